@@ -1,5 +1,6 @@
 import 'dart:math' as math;
 import 'dart:io';
+import 'dart:typed_data';
 import 'package:dio/dio.dart';
 import 'package:flutter/foundation.dart';
 import 'package:path_provider/path_provider.dart';
@@ -169,15 +170,35 @@ class TFLiteModelService {
       });
     }
 
-    // Prepare input (Tensor 1xN) and output (Tensor 1xM)
-    final input = [normalizedFeatures];
-    final output = List.filled(
-      interpreter.getOutputTensors().first.shape.last,
-      0.0,
-    ).reshape([1, -1]);
+    final inputTensor = interpreter.getInputTensor(0);
+    final List<double> prediction;
+    if (inputTensor.type == TensorType.int8) {
+      // Full-integer model: quantize with the input tensor's (scale, zero
+      // point) and dequantize the output the same way
+      final inQ = inputTensor.params;
+      final quantized = Int8List.fromList(normalizedFeatures
+          .map((x) => (x / inQ.scale + inQ.zeroPoint).round().clamp(-128, 127).toInt())
+          .toList());
+      inputTensor.setTo(quantized.buffer.asUint8List());
+      interpreter.invoke();
+
+      final outputTensor = interpreter.getOutputTensor(0);
+      final outQ = outputTensor.params;
+      final bytes = outputTensor.data;
+      prediction = Int8List.view(bytes.buffer, bytes.offsetInBytes, bytes.length)
+          .map((q) => (q - outQ.zeroPoint) * outQ.scale)
+          .toList();
+    } else {
+      // Prepare input (Tensor 1xN) and output (Tensor 1xM)
+      final input = [normalizedFeatures];
+      final output = List.filled(
+        interpreter.getOutputTensors().first.shape.last,
+        0.0,
+      ).reshape([1, -1]);
 
-    interpreter.run(input, output);
-    final prediction = List<double>.from(output[0]);
+      interpreter.run(input, output);
+      prediction = List<double>.from(output[0]);
+    }
 
     // Reuse the interpretation logic from the backend (implemented here in Dart)
     // In a real app, this would be a shared utility or duplicated logic.
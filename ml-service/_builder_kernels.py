@@ -0,0 +1,66 @@
+"""
+Numba kernels for the synthetic training targets in tflite_builder.
+
+Only the model builder imports these, so they live apart from _kernels, the
+serving hot path; _kernels' njit/prange shim still covers a missing numba.
+This file is hashed into every model's build key, _kernels is not.
+"""
+import numpy as np
+
+from _kernels import njit, prange
+
+# One fused pass per row over the generator's float32 feature matrix, so the
+# weighted clip terms never materialize as full-length temporaries.
+
+@njit(cache=True)
+def _clip01(x):
+    return min(max(x, 0.0), 1.0)
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def synthetic_gait_score(X: np.ndarray) -> np.ndarray:
+    """Form score (0-100, before noise) for rows of GAIT_FEATURE_RANGES features."""
+    out = np.empty(X.shape[0], dtype=np.float32)
+    for i in prange(X.shape[0]):
+        out[i] = (
+            30 * _clip01((X[i, 2] - 140) / 60)       # Higher cadence = better
+            + 20 * _clip01((300 - X[i, 0]) / 120)    # Lower GCT = better
+            + 15 * _clip01((12 - X[i, 1]) / 7)       # Lower oscillation = better
+            + 10 * _clip01((10 - X[i, 5]) / 8)       # Lower hip drop = better
+            + 10 * _clip01((X[i, 6] - 70) / 30)      # Higher symmetry = better
+            + 10 * _clip01((10 - X[i, 4]) / 8)       # Moderate lean = better
+            + 5 * _clip01((1.3 - X[i, 3]) / 0.6)     # Moderate stride = better
+        )
+    return out
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def synthetic_injury_risk(X: np.ndarray) -> np.ndarray:
+    """Risk score (0-1, before noise) for rows of INJURY_FEATURE_RANGES features."""
+    out = np.empty(X.shape[0], dtype=np.float32)
+    for i in prange(X.shape[0]):
+        out[i] = (
+            0.15 * _clip01((X[i, 0] - 250) / 100)
+            + 0.15 * _clip01((X[i, 1] - 10) / 5)
+            + 0.15 * _clip01((170 - X[i, 2]) / 30)
+            + 0.1 * _clip01((X[i, 3] - 1.1) / 0.4)
+            + 0.15 * _clip01((X[i, 4] - 6) / 6)
+            + 0.1 * _clip01((X[i, 5] - 60) / 60)
+            + 0.2 * _clip01((X[i, 6] - 1.3) / 0.7)
+        )
+    return out
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def synthetic_5k_seconds(X: np.ndarray) -> np.ndarray:
+    """5K time (seconds, before noise) for rows of PERFORMANCE_FEATURE_RANGES features."""
+    out = np.empty(X.shape[0], dtype=np.float32)
+    for i in prange(X.shape[0]):
+        out[i] = (
+            X[i, 1] * (5 * 60 * 0.88)                    # Race pace ~12% faster than training
+            - 120 * _clip01((X[i, 0] - 30) / 70)         # More volume = faster
+            - 90 * _clip01((70 - X[i, 4]) / 30)          # Lower RHR = faster
+            - 60 * _clip01((X[i, 5] - 40) / 60)          # Higher HRV = faster
+            - 45 * _clip01((X[i, 2] - 3) / 4)            # Consistency
+        )
+    return out
@@ -0,0 +1,96 @@
+"""
+Numeric kernels for the ML service hot paths.
+
+Compiled with Numba when it is installed; otherwise the same functions run
+as plain Python/NumPy, so the service works either way.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - exercised only without numba
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+
+    prange = range
+
+# Riegel distance multipliers relative to 5K: (D2/5)^1.06
+RIEGEL_10K = (10 / 5) ** 1.06
+RIEGEL_HALF = (21.1 / 5) ** 1.06
+RIEGEL_MARATHON = (42.2 / 5) ** 1.06
+
+# Injury risk rules, one entry per bit of the returned mask:
+#   0: cadence < 160          3: vertical oscillation > 12
+#   1: 160 <= cadence < 170   4: hip drop > 8
+#   2: ground contact > 300   5: stride > 1.3 and cadence < 170
+# Weights are whole percentage points (0.2 -> 20) so the score is exact at
+# 2 decimals and needs no round() before serialization.
+RISK_POINTS = (20, 10, 15, 15, 20, 15)
+
+
+@njit(cache=True, fastmath=True)
+def riegel_batch(t5k: np.ndarray) -> np.ndarray:
+    """Extrapolate 5K times (seconds) to a (N, 4) array of 5K/10K/half/marathon."""
+    out = np.empty((t5k.shape[0], 4))
+    out[:, 0] = t5k
+    out[:, 1] = t5k * RIEGEL_10K
+    out[:, 2] = t5k * RIEGEL_HALF
+    out[:, 3] = t5k * RIEGEL_MARATHON
+    return out
+
+
+@njit(cache=True)
+def injury_score(
+    cadence: float,
+    ground_contact_ms: float,
+    vertical_osc_cm: float,
+    hip_drop_deg: float,
+    stride_m: float,
+):
+    """Return (risk_score, triggered-rule bitmask) for one gait sample."""
+    triggered = (
+        cadence < 160,
+        160 <= cadence < 170,
+        ground_contact_ms > 300,
+        vertical_osc_cm > 12,
+        hip_drop_deg > 8,
+        stride_m > 1.3 and cadence < 170,
+    )
+    points = 0
+    mask = 0
+    for i in range(6):
+        if triggered[i]:
+            points += RISK_POINTS[i]
+            mask |= 1 << i
+    return min(points, 100) / 100, mask
+
+
+# EWMA smoothing factors for the 7-day acute and 28-day chronic windows
+ACUTE_ALPHA = 1 / 7
+CHRONIC_ALPHA = 1 / 28
+
+
+@njit(cache=True)
+def ewma_loads(daily_load: np.ndarray):
+    """
+    Return (acute, chronic) exponentially-weighted loads for a daily series.
+
+    Both averages are seeded with the first day, oldest first, matching
+    pandas ``ewm(alpha=..., adjust=False)``.
+    """
+    acute = daily_load[0]
+    chronic = daily_load[0]
+    for i in range(1, daily_load.shape[0]):
+        x = daily_load[i]
+        acute += ACUTE_ALPHA * (x - acute)
+        chronic += CHRONIC_ALPHA * (x - chronic)
+    return acute, chronic
+
+
+def warmup() -> None:
+    """Trigger JIT compilation so the first request doesn't pay for it."""
+    riegel_batch(np.array([1200.0]))
+    injury_score(170.0, 250.0, 10.0, 5.0, 1.1)
+    ewma_loads(np.array([5.0, 6.0]))
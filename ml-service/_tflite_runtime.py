@@ -0,0 +1,108 @@
+"""
+Reusable TFLite interpreters shared by the server and the model builder.
+
+main.py serves inference from these and tflite_builder validates exports
+with them, so batch resizing and int8 I/O (de)quantization are defined once.
+The server passes raw rows plus its norm params, the builder already
+standardized features; TensorFlow is imported on first load, so without it
+load_interpreter() raises ImportError.
+"""
+import threading
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+@dataclass
+class PooledInterpreter:
+    """An allocated interpreter plus the tensor metadata bound once at load time."""
+    interp: object
+    in_idx: int
+    out_idx: int
+    in_shape: Tuple[int, ...]
+    in_dtype: type
+    out_dtype: type
+    in_quant: Tuple[float, int]
+    out_quant: Tuple[float, int]
+    # float32 staging buffer of in_shape: features are standardized and
+    # quantized in place here, so a steady-shape invoke allocates nothing
+    scratch: np.ndarray
+    # An interpreter is not thread-safe; held for the whole set/invoke/get
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
+def load_interpreter(model_path: str) -> PooledInterpreter:
+    """Load and allocate an interpreter for a .tflite file."""
+    import tensorflow as tf
+
+    # Loading by path (not model_content=) lets TFLite mmap the flatbuffer
+    # read-only, so every uvicorn worker (WEB_CONCURRENCY) shares the same
+    # page-cache pages instead of holding a private copy of each model.
+    interpreter = tf.lite.Interpreter(model_path=model_path)
+    interpreter.allocate_tensors()
+    in_det = interpreter.get_input_details()[0]
+    out_det = interpreter.get_output_details()[0]
+    return PooledInterpreter(
+        interp=interpreter,
+        in_idx=in_det["index"],
+        out_idx=out_det["index"],
+        in_shape=tuple(in_det["shape"]),
+        in_dtype=in_det["dtype"],
+        out_dtype=out_det["dtype"],
+        in_quant=in_det["quantization"],
+        out_quant=out_det["quantization"],
+        scratch=np.empty(in_det["shape"], dtype=np.float32),
+    )
+
+
+def invoke(
+    pooled: PooledInterpreter,
+    rows,
+    mean: Optional[np.ndarray] = None,
+    inv_std: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Run an (N, F) batch of feature rows with one invoke.
+
+    Rows are standardized with ``(x - mean) * inv_std`` when mean is given.
+    The input tensor is only resized when N changes; int8 models get their
+    inputs quantized and outputs dequantized with the tensors' own params.
+    """
+    interpreter = pooled.interp
+    shape = (len(rows), len(rows[0]))
+
+    with pooled.lock:
+        if pooled.in_shape != shape:
+            interpreter.resize_tensor_input(pooled.in_idx, shape, strict=True)
+            interpreter.allocate_tensors()
+            pooled.in_shape = shape
+            pooled.scratch = np.empty(shape, dtype=np.float32)
+
+        features = pooled.scratch
+        features[...] = rows
+        if mean is not None:
+            np.subtract(features, mean, out=features)
+            np.multiply(features, inv_std, out=features)
+        if np.issubdtype(pooled.in_dtype, np.integer):
+            # Handle quantized inputs
+            input_scale, input_zero = pooled.in_quant
+            info = np.iinfo(pooled.in_dtype)
+            np.divide(features, input_scale, out=features)
+            np.add(features, input_zero, out=features)
+            np.rint(features, out=features)
+            np.clip(features, info.min, info.max, out=features)
+        # Write straight into the input tensor's buffer (casting to its dtype)
+        # instead of having set_tensor copy. The view must be gone before
+        # invoke(), so it is never bound to a name.
+        interpreter.tensor(pooled.in_idx)()[...] = features
+        interpreter.invoke()
+        output = interpreter.get_tensor(pooled.out_idx)
+
+    # Dequantize output
+    if np.issubdtype(pooled.out_dtype, np.integer):
+        output_scale, output_zero = pooled.out_quant
+        output = output.astype(np.float32)
+        np.subtract(output, output_zero, out=output)
+        np.multiply(output, output_scale, out=output)
+    return output
@@ -8,15 +8,31 @@ FastAPI service for:
 - Custom TFLite model generation for on-device inference
 - TFLite model serving and download
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, Header, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Annotated, Optional, List, Dict, Tuple
 from pathlib import Path
+from contextlib import asynccontextmanager
+from bisect import bisect_right
+from dataclasses import dataclass
+from enum import IntEnum
 import numpy as np
-import json
+import anyio
+import hashlib
+import logging
+import msgspec
+import orjson
+import math
 import os
+import time
+
+import _kernels
+import _tflite_runtime
+
+logger = logging.getLogger(__name__)
 
 APP_VERSION = os.environ.get("APP_VERSION", "1.0.0")
 MODELS_DIR = Path(__file__).parent / "models"
@@ -41,10 +57,22 @@ def runtime_port(default: int = 8001) -> int:
     except ValueError:
         return default
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load model catalog + normalization params once instead of per request
+    _refresh_caches()
+    _kernels.warmup()
+    # Warm the interpreter pool so the first inference doesn't pay the load
+    await anyio.to_thread.run_sync(_load_interpreters)
+    yield
+
+
 app = FastAPI(
     title="ApexRun ML Service",
     description="Machine Learning models for running performance analysis",
     version=APP_VERSION,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -60,7 +88,7 @@ app.add_middleware(
 # Request/Response Models
 # ================================================================
 
-class GaitAnalysisRequest(BaseModel):
+class GaitAnalysisRequest(msgspec.Struct, kw_only=True):
     """Request for gait analysis prediction."""
     ground_contact_time_ms: float
     vertical_oscillation_cm: float
@@ -71,15 +99,15 @@ class GaitAnalysisRequest(BaseModel):
     avg_pace_min_per_km: float
 
 
-class InjuryRiskResponse(BaseModel):
+class InjuryRiskResponse(msgspec.Struct):
     """Injury risk prediction result."""
     risk_score: float  # 0.0 - 1.0
     risk_level: str  # low, moderate, high
-    risk_factors: List[str]
-    recommendations: List[str]
+    risk_factor_ids: List[int]  # indices into /api/v1/catalog risk_factors
+    recommendation_ids: List[int]  # indices into /api/v1/catalog recommendations
 
 
-class PerformanceForecast(BaseModel):
+class PerformanceForecast(msgspec.Struct):
     """Performance prediction for upcoming race."""
     predicted_5k_seconds: int
     predicted_10k_seconds: int
@@ -89,7 +117,7 @@ class PerformanceForecast(BaseModel):
     training_suggestions: List[str]
 
 
-class TrainingLoadRequest(BaseModel):
+class TrainingLoadRequest(msgspec.Struct, kw_only=True):
     """Weekly training data for load analysis."""
     weekly_distance_km: float
     weekly_duration_minutes: int
@@ -100,7 +128,19 @@ class TrainingLoadRequest(BaseModel):
     hrv_rmssd: Optional[float] = None
 
 
-class TrainingLoadResponse(BaseModel):
+class TrainingLoadSeriesRequest(msgspec.Struct, kw_only=True):
+    """Daily training load history (e.g. TRIMP or km), oldest day first."""
+    # Ideally >= 28 days. Loads are non-negative: a negative day could drive
+    # chronic load <= 0, which the ACWR fallback would report as optimal.
+    daily_load: List[Annotated[float, msgspec.Meta(ge=0)]]
+    hrv_rmssd: Optional[float] = None
+
+    def __post_init__(self):
+        if not self.daily_load:
+            raise ValueError("daily_load must contain at least one day")
+
+
+class TrainingLoadResponse(msgspec.Struct):
     """Training load analysis result."""
     acute_load: float
     chronic_load: float
@@ -109,6 +149,53 @@ class TrainingLoadResponse(BaseModel):
     recommendation: str
 
 
+# Hot-path requests/responses are msgspec Structs: bodies are decoded from raw
+# bytes and responses encoded straight to bytes, skipping FastAPI's Pydantic
+# validation and jsonable_encoder round trip.
+_json_encoder = msgspec.json.Encoder()
+
+
+def _struct_schema(struct_type: type) -> dict:
+    """Inline JSON schema for a flat msgspec Struct."""
+    return msgspec.json.schema(struct_type)["$defs"][struct_type.__name__]
+
+
+def _struct_body(struct_type: type):
+    """FastAPI dependency decoding the JSON request body into ``struct_type``."""
+    # strict=False keeps Pydantic-style coercion (e.g. 170.0 for an int field)
+    decoder = msgspec.json.Decoder(struct_type, strict=False)
+
+    async def decode(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except msgspec.DecodeError as e:
+            raise RequestValidationError([
+                {"type": "value_error", "loc": ("body",), "msg": str(e), "input": None},
+            ])
+
+    return decode
+
+
+def _struct_request_openapi(struct_type: type) -> dict:
+    """``openapi_extra`` documenting a msgspec Struct request body."""
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": _struct_schema(struct_type)}},
+            "required": True,
+        },
+    }
+
+
+def _struct_response(obj: msgspec.Struct) -> Response:
+    """Encode a msgspec Struct into a ready-to-send JSON response."""
+    return Response(content=_json_encoder.encode(obj), media_type="application/json")
+
+
+def _struct_openapi(struct_type: type) -> dict:
+    """OpenAPI ``responses`` entry documenting a msgspec Struct body."""
+    return {200: {"content": {"application/json": {"schema": _struct_schema(struct_type)}}}}
+
+
 class RecoveryRequest(BaseModel):
     """Request for daily recovery analysis."""
     user_id: str
@@ -230,8 +317,38 @@ async def ready():
 # Gait Analysis & Injury Risk
 # ================================================================
 
-@app.post("/api/v1/gait/injury-risk", response_model=InjuryRiskResponse)
-async def predict_injury_risk(request: GaitAnalysisRequest):
+# Responses carry indices into these tables; clients fetch the text once from
+# /api/v1/catalog. Factor ids are the _kernels.injury_score rule bits.
+_FACTOR_STRINGS = (
+    "Very low cadence increases impact forces",
+    "Below-optimal cadence",
+    "Extended ground contact time → overstriding risk",
+    "High vertical oscillation increases joint stress",
+    "Excessive hip drop — glute weakness indicator",
+    "Long stride + low cadence = overstriding pattern",
+    "No significant risk factors detected",
+)
+_RECOMMENDATION_STRINGS = (
+    "Increase step rate by 5-10% over 4 weeks",
+    "Focus on quick, light steps",
+    "Run 'quiet' — minimize up-down motion",
+    "Add single-leg glute bridges and clamshells 3x/week",
+    "Shorten stride and increase turnover",
+    "Good biomechanics! Maintain current form focus.",
+)
+_N_RISK_RULES = 6
+_NO_FACTORS_ID = 6
+_GOOD_FORM_ID = 5
+# Recommendation id per rule bit (None: rule has no recommendation of its own)
+_RULE_RECOMMENDATION = (0, None, 1, 2, 3, 4)
+
+
+@app.post(
+    "/api/v1/gait/injury-risk",
+    responses=_struct_openapi(InjuryRiskResponse),
+    openapi_extra=_struct_request_openapi(GaitAnalysisRequest),
+)
+async def predict_injury_risk(request: GaitAnalysisRequest = Depends(_struct_body(GaitAnalysisRequest))):
     """
     Predict injury risk based on gait biomechanics.
     
@@ -241,63 +358,83 @@ async def predict_injury_risk(request: GaitAnalysisRequest):
     - Excessive hip drop → ITB issues  
     - High vertical oscillation → energy waste + joint stress
     """
-    risk_factors = []
-    recommendations = []
-    risk_score = 0.0
-
-    # Cadence analysis
-    if request.cadence_spm < 160:
-        risk_score += 0.2
-        risk_factors.append("Very low cadence increases impact forces")
-        recommendations.append("Increase step rate by 5-10% over 4 weeks")
-    elif request.cadence_spm < 170:
-        risk_score += 0.1
-        risk_factors.append("Below-optimal cadence")
-
-    # Ground contact time
-    if request.ground_contact_time_ms > 300:
-        risk_score += 0.15
-        risk_factors.append("Extended ground contact time → overstriding risk")
-        recommendations.append("Focus on quick, light steps")
-
-    # Vertical oscillation
-    if request.vertical_oscillation_cm > 12:
-        risk_score += 0.15
-        risk_factors.append("High vertical oscillation increases joint stress")
-        recommendations.append("Run 'quiet' — minimize up-down motion")
-
-    # Hip drop
-    if request.hip_drop_degrees and request.hip_drop_degrees > 8:
-        risk_score += 0.2
-        risk_factors.append("Excessive hip drop — glute weakness indicator")
-        recommendations.append("Add single-leg glute bridges and clamshells 3x/week")
-
-    # Overstriding
-    if request.stride_length_m > 1.3 and request.cadence_spm < 170:
-        risk_score += 0.15
-        risk_factors.append("Long stride + low cadence = overstriding pattern")
-        recommendations.append("Shorten stride and increase turnover")
-
-    risk_score = min(risk_score, 1.0)
+    risk_score, mask = _kernels.injury_score(
+        # float() keeps the int field on the all-float64 signature warmup() compiled
+        float(request.cadence_spm),
+        request.ground_contact_time_ms,
+        request.vertical_oscillation_cm,
+        # Missing hip drop can never trigger its rule; 0.0 is a real reading
+        request.hip_drop_degrees if request.hip_drop_degrees is not None else -math.inf,
+        request.stride_length_m,
+    )
     risk_level = "low" if risk_score < 0.3 else "moderate" if risk_score < 0.6 else "high"
 
-    if not recommendations:
-        recommendations.append("Good biomechanics! Maintain current form focus.")
+    risk_factor_ids = [i for i in range(_N_RISK_RULES) if mask >> i & 1]
+    recommendation_ids = [
+        _RULE_RECOMMENDATION[i] for i in risk_factor_ids if _RULE_RECOMMENDATION[i] is not None
+    ]
 
-    return InjuryRiskResponse(
-        risk_score=round(risk_score, 2),
+    return _struct_response(InjuryRiskResponse(
+        risk_score=risk_score,
         risk_level=risk_level,
-        risk_factors=risk_factors if risk_factors else ["No significant risk factors detected"],
-        recommendations=recommendations,
-    )
+        risk_factor_ids=risk_factor_ids or [_NO_FACTORS_ID],
+        recommendation_ids=recommendation_ids or [_GOOD_FORM_ID],
+    ))
+
+
+class CatalogResponse(BaseModel):
+    """String tables for the id fields of rule-based responses."""
+    risk_factors: List[str]
+    recommendations: List[str]
+
+
+# The catalog is static, so its body and ETag are computed once at import
+_CATALOG_JSON = orjson.dumps({
+    "risk_factors": _FACTOR_STRINGS,
+    "recommendations": _RECOMMENDATION_STRINGS,
+})
+_CATALOG_ETAG = f'"{hashlib.sha256(_CATALOG_JSON).hexdigest()[:16]}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weak comparison of an If-None-Match header against ``etag`` (RFC 9110).
+
+    nginx's gzip turns our strong tag into ``W/"..."``, which clients echo
+    back, so the ``W/`` prefix is ignored; ``*`` matches any tag.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+@app.get("/api/v1/catalog", response_model=CatalogResponse)
+async def get_catalog(if_none_match: Optional[str] = Header(None)):
+    """
+    Text for ``risk_factor_ids`` / ``recommendation_ids``.
+
+    Clients should cache this and revalidate with ``If-None-Match``.
+    """
+    headers = {"ETag": _CATALOG_ETAG, "Cache-Control": "public, max-age=86400"}
+    if _etag_matches(if_none_match, _CATALOG_ETAG):
+        return Response(status_code=304, headers=headers)
+    return Response(content=_CATALOG_JSON, media_type="application/json", headers=headers)
 
 
 # ================================================================
 # Performance Forecasting
 # ================================================================
 
-@app.post("/api/v1/performance/forecast", response_model=PerformanceForecast)
-async def forecast_performance(request: TrainingLoadRequest):
+@app.post(
+    "/api/v1/performance/forecast",
+    responses=_struct_openapi(PerformanceForecast),
+    openapi_extra=_struct_request_openapi(TrainingLoadRequest),
+)
+async def forecast_performance(request: TrainingLoadRequest = Depends(_struct_body(TrainingLoadRequest))):
     """
     Predict race times based on training data.
     
@@ -311,23 +448,24 @@ async def forecast_performance(request: TrainingLoadRequest):
 
     # Riegel's formula for distance predictions
     t_5k = int(race_5k_pace * 5)
-    t_10k = int(t_5k * (10 / 5) ** 1.06)
-    t_half = int(t_5k * (21.1 / 5) ** 1.06)
-    t_marathon = int(t_5k * (42.2 / 5) ** 1.06)
+    t_10k = int(t_5k * _kernels.RIEGEL_10K)
+    t_half = int(t_5k * _kernels.RIEGEL_HALF)
+    t_marathon = int(t_5k * _kernels.RIEGEL_MARATHON)
 
-    # Confidence based on training volume
-    base_confidence = 0.5
+    # Confidence based on training volume, in whole percentage points so the
+    # result is already at 2-decimal precision without a round() call
+    confidence_pct = 50
     if request.weekly_distance_km >= 50:
-        base_confidence += 0.2
+        confidence_pct += 20
     elif request.weekly_distance_km >= 30:
-        base_confidence += 0.15
+        confidence_pct += 15
     elif request.weekly_distance_km >= 20:
-        base_confidence += 0.1
+        confidence_pct += 10
 
     if request.run_count >= 5:
-        base_confidence += 0.1
+        confidence_pct += 10
     if request.run_count >= 4:
-        base_confidence += 0.05
+        confidence_pct += 5
 
     suggestions = []
     if request.weekly_distance_km < 30:
@@ -337,22 +475,53 @@ async def forecast_performance(request: TrainingLoadRequest):
     if request.avg_pace_min_per_km > 7:
         suggestions.append("Include one tempo run per week to improve speed")
 
-    return PerformanceForecast(
+    return _struct_response(PerformanceForecast(
         predicted_5k_seconds=t_5k,
         predicted_10k_seconds=t_10k,
         predicted_half_marathon_seconds=t_half,
         predicted_marathon_seconds=t_marathon,
-        confidence=round(min(base_confidence, 0.95), 2),
+        confidence=min(confidence_pct, 95) / 100,
         training_suggestions=suggestions if suggestions else ["Great training — maintain consistency!"],
-    )
+    ))
 
 
 # ================================================================
 # Training Load Analysis (ACWR)
 # ================================================================
 
-@app.post("/api/v1/training/load", response_model=TrainingLoadResponse)
-async def analyze_training_load(request: TrainingLoadRequest):
+# ACWR status decision table. bisect_right counts thresholds <= acwr; the
+# upper two are nudged one ulp up so 1.3 and 1.5 stay inclusive (<=) while
+# 0.8 is exclusive (<), matching the guideline bands below.
+_ACWR_THRESHOLDS = (0.8, math.nextafter(1.3, math.inf), math.nextafter(1.5, math.inf))
+_ACWR_STATUS = ("detraining", "optimal", "overreaching", "overtraining")
+_ACWR_RECOMMENDATIONS = (
+    "Your training load has decreased significantly. Gradually increase volume to maintain fitness.",
+    "Training load is in the sweet spot. Maintain current progression rate.",
+    "Training load spike detected. Consider an easy week to allow adaptation.",
+    "High injury risk! Reduce volume by 30-40% this week and focus on recovery.",
+)
+
+# With chronic load estimated as a fixed fraction of acute load, the ratio is
+# the constant 1 / 0.85 ≈ 1.18 regardless of input.
+_PLACEHOLDER_CHRONIC_FRACTION = 0.85
+_PLACEHOLDER_ACWR = 1 / _PLACEHOLDER_CHRONIC_FRACTION
+
+
+def _classify_acwr(acwr: float, hrv_rmssd: Optional[float]) -> Tuple[str, str]:
+    """Map an ACWR (plus optional HRV) to a training status and recommendation."""
+    idx = bisect_right(_ACWR_THRESHOLDS, acwr)
+    # Low HRV downgrades an otherwise optimal load
+    if idx == 1 and hrv_rmssd is not None and hrv_rmssd < 30:
+        return "overreaching", "Low HRV detected despite normal load. Prioritize recovery this week."
+    return _ACWR_STATUS[idx], _ACWR_RECOMMENDATIONS[idx]
+
+
+@app.post(
+    "/api/v1/training/load",
+    responses=_struct_openapi(TrainingLoadResponse),
+    openapi_extra=_struct_request_openapi(TrainingLoadRequest),
+)
+async def analyze_training_load(request: TrainingLoadRequest = Depends(_struct_body(TrainingLoadRequest))):
     """
     Analyze training load using Acute:Chronic Workload Ratio (ACWR).
     
@@ -361,44 +530,55 @@ async def analyze_training_load(request: TrainingLoadRequest):
     - 0.8-1.3: Sweet spot (minimal injury risk)
     - 1.3-1.5: Overreaching (caution)
     - > 1.5: Danger zone (high injury risk)
+
+    Note: chronic load is not yet read from activity history; it is
+    estimated as 85% of this week's load, so the ratio is always ~1.18 and
+    the status only changes with HRV. Treat the result as a placeholder
+    until a real rolling chronic load is wired in.
     """
     # Calculate acute load (this week's training stress)
     acute_load = request.weekly_distance_km * (1 + (1 / request.avg_pace_min_per_km))
 
-    # Estimate chronic load (assume ~80% of acute for a typical training block)
+    # Estimate chronic load (assume ~85% of acute for a typical training block)
     # In production, this would use 4-week rolling average from database
-    chronic_load = acute_load * 0.85
+    chronic_load = acute_load * _PLACEHOLDER_CHRONIC_FRACTION
+    acwr = _PLACEHOLDER_ACWR if chronic_load > 0 else 1.0
 
-    # ACWR
-    acwr = acute_load / chronic_load if chronic_load > 0 else 1.0
-
-    # Determine training status
-    if acwr < 0.8:
-        status = "detraining"
-        recommendation = "Your training load has decreased significantly. Gradually increase volume to maintain fitness."
-    elif acwr <= 1.3:
-        status = "optimal"
-        recommendation = "Training load is in the sweet spot. Maintain current progression rate."
-    elif acwr <= 1.5:
-        status = "overreaching"
-        recommendation = "Training load spike detected. Consider an easy week to allow adaptation."
-    else:
-        status = "overtraining"
-        recommendation = "High injury risk! Reduce volume by 30-40% this week and focus on recovery."
+    status, recommendation = _classify_acwr(acwr, request.hrv_rmssd)
 
-    # Adjust for HRV if available
-    if request.hrv_rmssd is not None and request.hrv_rmssd < 30:
-        if status == "optimal":
-            status = "overreaching"
-            recommendation = "Low HRV detected despite normal load. Prioritize recovery this week."
-
-    return TrainingLoadResponse(
+    return _struct_response(TrainingLoadResponse(
         acute_load=round(acute_load, 1),
         chronic_load=round(chronic_load, 1),
         acute_chronic_ratio=round(acwr, 2),
         training_status=status,
         recommendation=recommendation,
-    )
+    ))
+
+
+@app.post(
+    "/api/v1/training/load/series",
+    responses=_struct_openapi(TrainingLoadResponse),
+    openapi_extra=_struct_request_openapi(TrainingLoadSeriesRequest),
+)
+async def analyze_training_load_series(request: TrainingLoadSeriesRequest = Depends(_struct_body(TrainingLoadSeriesRequest))):
+    """
+    Analyze training load from a daily history using EWMA-based ACWR.
+
+    Acute and chronic loads are exponentially-weighted averages over 7 and
+    28 days. Send at least 28 days for a meaningful chronic load.
+    """
+    acute_load, chronic_load = _kernels.ewma_loads(np.asarray(request.daily_load, dtype=np.float64))
+    acwr = acute_load / chronic_load if chronic_load > 0 else 1.0
+
+    status, recommendation = _classify_acwr(acwr, request.hrv_rmssd)
+
+    return _struct_response(TrainingLoadResponse(
+        acute_load=round(float(acute_load), 1),
+        chronic_load=round(float(chronic_load), 1),
+        acute_chronic_ratio=round(float(acwr), 2),
+        training_status=status,
+        recommendation=recommendation,
+    ))
 
 
 # ================================================================
@@ -630,15 +810,6 @@ async def analyze_gait_advanced(request: GaitAdvancedRequest):
     }
 
 
-# ================================================================
-# Entry Point
-# ================================================================
-
-if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=runtime_port())
-
-
 # ================================================================
 # TFLite Model Management
 # ================================================================
@@ -659,71 +830,126 @@ class BuildModelsResponse(BaseModel):
     models: dict
 
 
-@app.get("/api/v1/models", response_model=List[TFLiteModelInfo])
-async def list_tflite_models():
-    """List all available TFLite models for download."""
-    models = []
-    model_catalog = {
-        "gait_form_model.tflite": {
-            "name": "Gait Form Analysis",
-            "description": "Scores running form (0-100) from biomechanical landmarks",
-            "input_features": [
-                "ground_contact_time_ms", "vertical_oscillation_cm",
-                "cadence_spm", "stride_length_m", "forward_lean_degrees",
-                "hip_drop_degrees", "arm_swing_symmetry_pct", "avg_pace_min_per_km"
-            ],
-        },
-        "injury_risk_model.tflite": {
-            "name": "Injury Risk Prediction",
-            "description": "Classifies injury risk as low/moderate/high",
-            "input_features": [
-                "ground_contact_time_ms", "vertical_oscillation_cm",
-                "cadence_spm", "stride_length_m", "hip_drop_degrees",
-                "weekly_distance_km", "acute_chronic_ratio"
-            ],
-        },
-        "performance_model.tflite": {
-            "name": "Performance Forecast",
-            "description": "Predicts 5K race time from training data",
-            "input_features": [
-                "weekly_distance_km", "avg_pace_min_per_km",
-                "run_count_per_week", "longest_run_km",
-                "resting_heart_rate", "hrv_rmssd"
-            ],
-        },
+MODEL_CATALOG = {
+    "gait_form_model.tflite": {
+        "name": "Gait Form Analysis",
+        "description": "Scores running form (0-100) from biomechanical landmarks",
+        "input_features": [
+            "ground_contact_time_ms", "vertical_oscillation_cm",
+            "cadence_spm", "stride_length_m", "forward_lean_degrees",
+            "hip_drop_degrees", "arm_swing_symmetry_pct", "avg_pace_min_per_km"
+        ],
+    },
+    "injury_risk_model.tflite": {
+        "name": "Injury Risk Prediction",
+        "description": "Classifies injury risk as low/moderate/high",
+        "input_features": [
+            "ground_contact_time_ms", "vertical_oscillation_cm",
+            "cadence_spm", "stride_length_m", "hip_drop_degrees",
+            "weekly_distance_km", "acute_chronic_ratio"
+        ],
+    },
+    "performance_model.tflite": {
+        "name": "Performance Forecast",
+        "description": "Predicts 5K race time from training data",
+        "input_features": [
+            "weekly_distance_km", "avg_pace_min_per_km",
+            "run_count_per_week", "longest_run_km",
+            "resting_heart_rate", "hrv_rmssd"
+        ],
+    },
+}
+
+# In-memory caches, filled at startup and after every model build. Builds in
+# another worker or from the CLI are picked up by _refresh_caches_if_stale(),
+# which rescans whenever MODELS_DIR's mtime moves (files added/replaced/removed).
+# _NORM_CACHE holds pre-serialized JSON so handlers return bytes as-is.
+# _FILES_CACHE maps each downloadable filename to its path. Only the name map
+# is cached: builds (from any worker or the CLI) replace files in place, so a
+# stat captured here would go stale and send the wrong Content-Length.
+_NORM_CACHE: Dict[str, bytes] = {}
+_MODELS_CACHE: List[TFLiteModelInfo] = []
+_MODELS_JSON = b"[]"
+_FILES_CACHE: Dict[str, str] = {}
+# MODELS_DIR st_mtime_ns the caches were built from
+_CACHES_MTIME_NS: Optional[int] = None
+
+
+def _refresh_caches() -> None:
+    """Rescan MODELS_DIR and rebuild the model catalog, file and normalization caches."""
+    global _MODELS_JSON, _CACHES_MTIME_NS
+    # Taken before the scan, so changes made during it trigger another refresh
+    mtime_ns = MODELS_DIR.stat().st_mtime_ns
+    files_cache = {
+        path.name: str(path)
+        for path in MODELS_DIR.iterdir()
+        if path.is_file()
     }
 
-    for filename, info in model_catalog.items():
-        filepath = MODELS_DIR / filename
-        if filepath.exists():
-            size_kb = round(filepath.stat().st_size / 1024, 1)
+    norm_cache = {}
+    for norm_path in MODELS_DIR.glob("*_norm_params.npz"):
+        model_name = norm_path.name[:-len("_norm_params.npz")]
+        with np.load(norm_path) as norm:
+            norm_cache[model_name] = orjson.dumps({key: norm[key].tolist() for key in norm.files})
+
+    models = []
+    for filename, info in MODEL_CATALOG.items():
+        if filename in files_cache:
             models.append(TFLiteModelInfo(
                 name=info["name"],
                 filename=filename,
-                size_kb=size_kb,
+                size_kb=round(os.path.getsize(files_cache[filename]) / 1024, 1),
                 description=info["description"],
                 input_features=info["input_features"],
                 download_url=f"/api/v1/models/{filename}",
             ))
 
-    return models
+    _NORM_CACHE.clear()
+    _NORM_CACHE.update(norm_cache)
+    _MODELS_CACHE[:] = models
+    _MODELS_JSON = orjson.dumps([model.model_dump() for model in models])
+    _FILES_CACHE.clear()
+    _FILES_CACHE.update(files_cache)
+    # Drop warm interpreters so rebuilt models are reloaded on next use
+    _INTERPRETERS.clear()
+    # Directory mtimes tick coarsely (a few ms), so a change landing in the
+    # same tick as the scan would leave it unchanged; until the mtime is a
+    # second old, treat the caches as stale and rescan on the next request.
+    _CACHES_MTIME_NS = mtime_ns if time.time_ns() - mtime_ns > 1_000_000_000 else None
+
+
+def _refresh_caches_if_stale() -> None:
+    """Rescan MODELS_DIR if it changed since the last refresh; one stat otherwise."""
+    if MODELS_DIR.stat().st_mtime_ns == _CACHES_MTIME_NS:
+        return
+    try:
+        _refresh_caches()
+    except Exception:
+        # e.g. a norm params file another process is still writing; keep the
+        # current caches and retry on the next request
+        logger.exception("Could not refresh model caches")
+
+
+@app.get("/api/v1/models", response_model=List[TFLiteModelInfo])
+async def list_tflite_models():
+    """List all available TFLite models for download."""
+    _refresh_caches_if_stale()
+    # Pre-serialized at refresh time; response_model is kept for the OpenAPI schema
+    return Response(content=_MODELS_JSON, media_type="application/json")
 
 
 @app.get("/api/v1/models/{filename}")
 async def download_tflite_model(filename: str):
     """Download a TFLite model file for on-device deployment."""
-    # Prevent path traversal
-    if ".." in filename or filename.startswith("/") or filename.startswith("\\"):
-        raise HTTPException(status_code=400, detail="Invalid filename")
-    
-    filepath = (MODELS_DIR / filename).resolve()
-    if not filepath.is_relative_to(MODELS_DIR.resolve()):
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    if not filepath.exists():
+    # Only files present in the cache are servable, which also rules out path traversal
+    _refresh_caches_if_stale()
+    path = _FILES_CACHE.get(filename)
+    if path is None:
         raise HTTPException(status_code=404, detail=f"Model '{filename}' not found. Run /api/v1/models/build first.")
+
+    # Starlette stats the file per request, so headers always match the bytes sent
     return FileResponse(
-        path=str(filepath),
+        path=path,
         media_type="application/octet-stream",
         filename=filename,
     )
@@ -732,33 +958,29 @@ async def download_tflite_model(filename: str):
 @app.get("/api/v1/models/{model_name}/normalization")
 async def get_normalization_params(model_name: str):
     """Get normalization parameters for a model (mean/std for inputs)."""
-    # Prevent path traversal
-    if ".." in model_name or model_name.startswith("/") or model_name.startswith("\\"):
-        raise HTTPException(status_code=400, detail="Invalid model name")
-
-    filename = f"{model_name}_norm_params.json"
-    norm_path = (MODELS_DIR / filename).resolve()
-    
-    if not norm_path.is_relative_to(MODELS_DIR.resolve()):
-        raise HTTPException(status_code=403, detail="Access denied")
-
-    if not norm_path.exists():
+    # Cache lookup by name, so arbitrary paths can never reach the filesystem
+    _refresh_caches_if_stale()
+    content = _NORM_CACHE.get(model_name)
+    if content is None:
         raise HTTPException(status_code=404, detail=f"Normalization params for '{model_name}' not found.")
-    with open(norm_path) as f:
-        return json.load(f)
+    return Response(content=content, media_type="application/json")
 
 
 @app.post("/api/v1/models/build", response_model=BuildModelsResponse)
-async def build_tflite_models():
+async def build_tflite_models(force: bool = False):
     """
     Train and export all TFLite models.
 
-    This is a compute-intensive operation (~1-2 minutes).
+    This is a compute-intensive operation (~10-20 seconds). Models whose build
+    inputs are unchanged are reused unless ``force`` is set.
     Models are saved to the models/ directory for download.
     """
     try:
         from tflite_builder import build_all_models
-        results = build_all_models(epochs=50)
+        # Training blocks for seconds; run it off the event loop so other
+        # requests on this worker keep being served meanwhile
+        results = await anyio.to_thread.run_sync(lambda: build_all_models(force=force))
+        _refresh_caches()
         return BuildModelsResponse(status="success", models=results)
     except ImportError:
         raise HTTPException(
@@ -774,11 +996,40 @@ async def build_tflite_models():
 # TFLite On-Device Inference (server-side fallback)
 # ================================================================
 
-class TFLiteInferenceRequest(BaseModel):
+class _ModelKind(IntEnum):
+    """Server-side inference models; values index _MODEL_TABLE."""
+    gait_form = 0
+    injury_risk = 1
+    performance = 2
+
+
+# (filename, expected feature count), indexed by _ModelKind
+_MODEL_TABLE = (
+    ("gait_form_model.tflite", 8),
+    ("injury_risk_model.tflite", 7),
+    ("performance_model.tflite", 6),
+)
+
+
+def _check_model_features(model: str, n_features: int) -> None:
+    """Raise ValueError unless ``model`` is known and takes ``n_features`` inputs."""
+    try:
+        kind = _ModelKind[model]
+    except KeyError:
+        raise ValueError(f"Unknown model: {model}") from None
+    expected_features = _MODEL_TABLE[kind][1]
+    if n_features != expected_features:
+        raise ValueError(f"Model '{model}' expects {expected_features} features, got {n_features}")
+
+
+class TFLiteInferenceRequest(msgspec.Struct):
     """Request for server-side TFLite inference."""
     model: str  # "gait_form", "injury_risk", or "performance"
     features: List[float]
 
+    def __post_init__(self):
+        _check_model_features(self.model, len(self.features))
+
 
 class TFLiteInferenceResponse(BaseModel):
     """Response from TFLite inference."""
@@ -787,38 +1038,96 @@ class TFLiteInferenceResponse(BaseModel):
     interpretation: dict
 
 
-@app.post("/api/v1/inference", response_model=TFLiteInferenceResponse)
-async def tflite_inference(request: TFLiteInferenceRequest):
-    """
-    Run TFLite inference server-side (fallback for devices without TFLite).
+# Rows per batch request. Each distinct N resizes the model's one pooled
+# interpreter under its lock, so this bounds how long a batch can hold it.
+MAX_BATCH_ROWS = 1024
 
-    Use this when the mobile device cannot run on-device inference.
-    """
-    model_map = {
-        "gait_form": ("gait_form_model.tflite", 8),
-        "injury_risk": ("injury_risk_model.tflite", 7),
-        "performance": ("performance_model.tflite", 6),
-    }
 
-    if request.model not in model_map:
-        raise HTTPException(status_code=400, detail=f"Unknown model: {request.model}")
+class TFLiteBatchInferenceRequest(msgspec.Struct):
+    """Request for batched server-side TFLite inference (N samples × F features)."""
+    model: str
+    features: Annotated[List[List[float]], msgspec.Meta(max_length=MAX_BATCH_ROWS)]
+
+    def __post_init__(self):
+        if not self.features:
+            raise ValueError("features must contain at least one row")
+        n_features = {len(row) for row in self.features}
+        if len(n_features) != 1:
+            raise ValueError("All feature rows must have the same length")
+        _check_model_features(self.model, n_features.pop())
+
+
+class TFLiteBatchInferenceResponse(BaseModel):
+    """Response from batched TFLite inference, one entry per input row."""
+    model: str
+    predictions: List[List[float]]
+    interpretations: List[dict]
 
-    filename, expected_features = model_map[request.model]
-    if len(request.features) != expected_features:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Model '{request.model}' expects {expected_features} features, got {len(request.features)}"
-        )
 
-    model_path = MODELS_DIR / filename
+def _model_path(model: str) -> Path:
+    """Path of a validated model's .tflite file; 404 if it hasn't been built."""
+    # Rebuilt elsewhere: refreshing drops the pooled interpreter for a reload
+    _refresh_caches_if_stale()
+    model_path = MODELS_DIR / _MODEL_TABLE[_ModelKind[model]][0]
     if not model_path.exists():
         raise HTTPException(status_code=404, detail=f"Model not built. POST /api/v1/models/build first.")
+    return model_path
 
+
+@dataclass
+class _InterpState:
+    """A pooled interpreter plus the model's feature standardization."""
+    pooled: _tflite_runtime.PooledInterpreter
+    # Models take standardized features: (x - mean) * inv_std from the norm params
+    mean: np.ndarray
+    inv_std: np.ndarray
+
+
+# Warm TFLite interpreters keyed by model filename
+_INTERPRETERS: Dict[str, _InterpState] = {}
+
+
+def _load_model(filename: str) -> _InterpState:
+    """Load a model's interpreter and norm params and add them to the pool."""
+    pooled = _tflite_runtime.load_interpreter(str(MODELS_DIR / filename))
+    model_name = filename[:-len("_model.tflite")]
+    with np.load(MODELS_DIR / f"{model_name}_norm_params.npz") as norm:
+        mean, std = norm["mean"], norm["std"]
+    state = _InterpState(pooled=pooled, mean=mean, inv_std=1 / std)
+    _INTERPRETERS[filename] = state
+    return state
+
+
+def _load_interpreters() -> None:
+    """
+    Populate the interpreter pool for every built model (no-op without TensorFlow).
+
+    A model that fails to load (corrupt file, missing norm params) is logged
+    and left to the lazy load in _invoke_interpreter, which fails only that
+    model's requests instead of the whole app's startup.
+    """
+    for filename in MODEL_CATALOG:
+        if not (MODELS_DIR / filename).exists():
+            continue
+        try:
+            _load_model(filename)
+        except ImportError:
+            return
+        except Exception:
+            logger.exception("Could not preload %s", filename)
+
+
+def _invoke_interpreter(filename: str, rows: List[List[float]]) -> np.ndarray:
+    """Standardize a batch of raw feature rows and run it through ``filename``'s pooled interpreter."""
+    state = _INTERPRETERS.get(filename) or _load_model(filename)
+    return _tflite_runtime.invoke(state.pooled, rows, state.mean, state.inv_std)
+
+
+async def _run_inference(model_path: Path, rows: List[List[float]]) -> np.ndarray:
+    """Run TFLite inference in a worker thread, returning a 2-D (N, outputs) array."""
     try:
-        from tflite_builder import run_tflite_inference
-        input_data = np.array(request.features, dtype=np.float32)
-        output = run_tflite_inference(str(model_path), input_data)
-        prediction = output.flatten().tolist()
+        # Offload to a worker thread so a slow invoke doesn't block other requests
+        output = await anyio.to_thread.run_sync(_invoke_interpreter, model_path.name, rows)
     except ImportError:
         raise HTTPException(
             status_code=503,
@@ -827,53 +1136,107 @@ async def tflite_inference(request: TFLiteInferenceRequest):
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Inference failed: {str(e)}")
+    return output
 
-    # Interpret results
-    interpretation = _interpret_prediction(request.model, prediction, request.features)
+
+@app.post(
+    "/api/v1/inference",
+    response_model=TFLiteInferenceResponse,
+    openapi_extra=_struct_request_openapi(TFLiteInferenceRequest),
+)
+async def tflite_inference(request: TFLiteInferenceRequest = Depends(_struct_body(TFLiteInferenceRequest))):
+    """
+    Run TFLite inference server-side (fallback for devices without TFLite).
+
+    Use this when the mobile device cannot run on-device inference.
+    """
+    model_path = _model_path(request.model)
+    output = await _run_inference(model_path, [request.features])
 
     return TFLiteInferenceResponse(
         model=request.model,
-        prediction=prediction,
-        interpretation=interpretation,
+        prediction=output[0].tolist(),
+        interpretation=_interpret_predictions(request.model, output)[0],
     )
 
 
-def _interpret_prediction(model_name: str, prediction: List[float], features: List[float]) -> dict:
-    """Convert raw predictions to human-readable interpretations."""
+@app.post(
+    "/api/v1/inference/batch",
+    response_model=TFLiteBatchInferenceResponse,
+    openapi_extra=_struct_request_openapi(TFLiteBatchInferenceRequest),
+)
+async def tflite_batch_inference(request: TFLiteBatchInferenceRequest = Depends(_struct_body(TFLiteBatchInferenceRequest))):
+    """
+    Run TFLite inference on N feature vectors with a single interpreter invoke.
+
+    All rows must have the model's feature count; at most ``MAX_BATCH_ROWS``
+    (1024) rows per request, larger sets should be split client-side.
+    """
+    model_path = _model_path(request.model)
+    output = await _run_inference(model_path, request.features)
+
+    return TFLiteBatchInferenceResponse(
+        model=request.model,
+        predictions=output.tolist(),
+        interpretations=_interpret_predictions(request.model, output),
+    )
+
+
+_FORM_LEVEL_THRESHOLDS = np.array([40, 60, 80])
+_FORM_LEVELS = np.array(["poor", "needs_work", "good", "excellent"])
+_RISK_LEVELS = np.array(["low", "moderate", "high"])
+
+
+def _interpret_predictions(model_name: str, output: np.ndarray) -> List[dict]:
+    """Convert a (N, outputs) prediction array to human-readable interpretations."""
+    # Round in float64 so values serialize as e.g. 97.3, not 97.30000305
+    output = output.astype(np.float64)
     if model_name == "gait_form":
-        score = max(0, min(100, prediction[0]))
-        level = "excellent" if score >= 80 else "good" if score >= 60 else "needs_work" if score >= 40 else "poor"
-        return {"form_score": round(score, 1), "level": level}
+        scores = np.clip(output[:, 0], 0, 100)
+        levels = _FORM_LEVELS[np.searchsorted(_FORM_LEVEL_THRESHOLDS, scores, side="right")]
+        return [
+            {"form_score": score, "level": level}
+            for score, level in zip(np.round(scores, 1).tolist(), levels.tolist())
+        ]
 
     elif model_name == "injury_risk":
-        if len(prediction) >= 3:
-            risk_idx = int(np.argmax(prediction))
-            levels = ["low", "moderate", "high"]
-            return {
-                "risk_level": levels[risk_idx],
-                "confidence": round(max(prediction) * 100, 1),
-                "probabilities": {
-                    "low": round(prediction[0] * 100, 1),
-                    "moderate": round(prediction[1] * 100, 1),
-                    "high": round(prediction[2] * 100, 1),
-                },
+        if output.shape[1] < 3:
+            return [{"risk_level": "unknown"} for _ in range(len(output))]
+        levels = _RISK_LEVELS[output.argmax(axis=1)]
+        confidence = np.round(output.max(axis=1) * 100, 1)
+        probs = np.round(output[:, :3] * 100, 1)
+        return [
+            {
+                "risk_level": level,
+                "confidence": conf,
+                "probabilities": {"low": low, "moderate": moderate, "high": high},
             }
-        return {"risk_level": "unknown"}
+            for level, conf, (low, moderate, high)
+            in zip(levels.tolist(), confidence.tolist(), probs.tolist())
+        ]
 
     elif model_name == "performance":
-        t_5k = max(720, prediction[0])
-        mins = int(t_5k // 60)
-        secs = int(t_5k % 60)
-        # Riegel extrapolation
-        t_10k = t_5k * (10 / 5) ** 1.06
-        t_half = t_5k * (21.1 / 5) ** 1.06
-        t_marathon = t_5k * (42.2 / 5) ** 1.06
-        return {
-            "predicted_5k": f"{mins}:{secs:02d}",
-            "predicted_5k_seconds": round(t_5k),
-            "predicted_10k_seconds": round(t_10k),
-            "predicted_half_marathon_seconds": round(t_half),
-            "predicted_marathon_seconds": round(t_marathon),
-        }
-
-    return {}
+        t_5k = np.maximum(720, output[:, 0])
+        # Riegel extrapolation, one column per distance
+        times = np.rint(_kernels.riegel_batch(t_5k))
+        return [
+            {
+                "predicted_5k": f"{int(t // 60)}:{int(t % 60):02d}",
+                "predicted_5k_seconds": int(t5),
+                "predicted_10k_seconds": int(t10),
+                "predicted_half_marathon_seconds": int(half),
+                "predicted_marathon_seconds": int(marathon),
+            }
+            for t, (t5, t10, half, marathon) in zip(t_5k.tolist(), times.tolist())
+        ]
+
+    return [{} for _ in range(len(output))]
+
+
+# ================================================================
+# Entry Point
+# ================================================================
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=runtime_port())
@@ -0,0 +1,99 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+INJURY_ROWS = [
+    [250, 10, 170, 1.1, 6, 40, 1.2],
+    [330, 14, 150, 1.4, 11, 100, 1.9],
+]
+
+
+def test_batch_inference_rejects_ragged_rows():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/inference/batch", json={
+        "model": "injury_risk",
+        "features": [INJURY_ROWS[0], INJURY_ROWS[1][:-1]],
+    })
+
+    assert response.status_code == 422
+
+
+def test_batch_inference_rejects_wrong_feature_count():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/inference/batch", json={
+        "model": "performance",
+        "features": [[40, 5, 4, 15, 55]],
+    })
+
+    assert response.status_code == 422
+    assert "Model 'performance' expects 6 features, got 5" in response.json()["detail"][0]["msg"]
+
+
+def test_batch_inference_rejects_oversized_batch():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/inference/batch", json={
+        "model": "injury_risk",
+        "features": [INJURY_ROWS[0]] * (main.MAX_BATCH_ROWS + 1),
+    })
+
+    assert response.status_code == 422
+
+
+def test_inference_rejects_unknown_model():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/inference", json={"model": "vo2max", "features": [1.0]})
+
+    assert response.status_code == 422
+    assert "Unknown model: vo2max" in response.json()["detail"][0]["msg"]
+
+
+def test_batch_inference_matches_single_row_inference():
+    pytest.importorskip("tensorflow")
+    client = TestClient(main.app)
+
+    batch = client.post("/api/v1/inference/batch", json={
+        "model": "injury_risk",
+        "features": INJURY_ROWS,
+    })
+    singles = [
+        client.post("/api/v1/inference", json={"model": "injury_risk", "features": row})
+        for row in INJURY_ROWS
+    ]
+
+    assert batch.status_code == 200
+    assert len(batch.json()["interpretations"]) == len(INJURY_ROWS)
+    for i, single in enumerate(singles):
+        assert single.status_code == 200
+        assert single.json()["interpretation"] == batch.json()["interpretations"][i]
+        assert single.json()["prediction"] == pytest.approx(batch.json()["predictions"][i], abs=1e-5)
+
+
+def test_inference_standardizes_raw_features():
+    pytest.importorskip("tensorflow")
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/inference/batch", json={
+        "model": "injury_risk",
+        "features": INJURY_ROWS,
+    })
+
+    assert response.status_code == 200
+    levels = [interpretation["risk_level"] for interpretation in response.json()["interpretations"]]
+    assert levels == ["low", "high"]
+
+
+def test_startup_survives_model_load_failure(monkeypatch):
+    def fail(filename):
+        raise FileNotFoundError(f"{filename} norm params missing")
+
+    monkeypatch.setattr(main, "_load_model", fail)
+
+    with TestClient(main.app) as client:
+        response = client.post("/api/v1/training/load/series", json={"daily_load": [5.0] * 28})
+
+    assert response.status_code == 200
@@ -0,0 +1,113 @@
+import asyncio
+import json
+import os
+import sys
+import types
+
+from fastapi.testclient import TestClient
+
+import main
+
+
+def test_normalization_params_are_served_from_cache():
+    with TestClient(main.app) as client:
+        response = client.get("/api/v1/models/gait_form/normalization")
+
+    with open(main.MODELS_DIR / "gait_form_norm_params.json") as f:
+        expected = json.load(f)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == expected
+
+
+def test_normalization_params_unknown_model_is_404():
+    with TestClient(main.app) as client:
+        response = client.get("/api/v1/models/..%2F..%2Fetc/normalization")
+
+    assert response.status_code == 404
+
+
+def test_model_list_matches_models_on_disk():
+    with TestClient(main.app) as client:
+        response = client.get("/api/v1/models")
+
+    assert response.status_code == 200
+    filenames = [model["filename"] for model in response.json()]
+    assert filenames == [
+        filename
+        for filename in main.MODEL_CATALOG
+        if (main.MODELS_DIR / filename).exists()
+    ]
+
+
+def test_model_download_serves_cached_file():
+    with TestClient(main.app) as client:
+        response = client.get("/api/v1/models/injury_risk_model.tflite")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.content == (main.MODELS_DIR / "injury_risk_model.tflite").read_bytes()
+
+
+def test_model_download_follows_replaced_file(tmp_path, monkeypatch):
+    path = tmp_path / "demo_model.tflite"
+    path.write_bytes(b"old")
+    with TestClient(main.app) as client:
+        monkeypatch.setitem(main._FILES_CACHE, path.name, str(path))
+        client.get(f"/api/v1/models/{path.name}")
+        replacement = tmp_path / "demo_model.tflite.tmp"
+        replacement.write_bytes(b"rebuilt elsewhere")
+        os.replace(replacement, path)
+
+        response = client.get(f"/api/v1/models/{path.name}")
+
+    assert response.status_code == 200
+    assert response.headers["content-length"] == str(len(b"rebuilt elsewhere"))
+    assert response.content == b"rebuilt elsewhere"
+
+
+def test_model_download_unknown_file_is_404():
+    with TestClient(main.app) as client:
+        response = client.get("/api/v1/models/..%2Fmain.py")
+
+    assert response.status_code == 404
+
+
+def test_model_build_runs_off_the_event_loop(monkeypatch):
+    on_event_loop = []
+
+    def build_all_models(force):
+        try:
+            asyncio.get_running_loop()
+            on_event_loop.append(True)
+        except RuntimeError:
+            on_event_loop.append(False)
+        return {}
+
+    monkeypatch.setitem(sys.modules, "tflite_builder", types.SimpleNamespace(build_all_models=build_all_models))
+
+    with TestClient(main.app) as client:
+        response = client.post("/api/v1/models/build")
+
+    assert response.status_code == 200
+    assert on_event_loop == [False]
+
+
+def test_model_files_built_elsewhere_are_served_without_restart(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, "MODELS_DIR", tmp_path)
+    path = tmp_path / "injury_risk_model.tflite"
+
+    with TestClient(main.app) as client:
+        assert client.get(f"/api/v1/models/{path.name}").status_code == 404
+        # e.g. `python tflite_builder.py` or another uvicorn worker's build
+        path.write_bytes(b"model")
+
+        listed = [model["filename"] for model in client.get("/api/v1/models").json()]
+        download = client.get(f"/api/v1/models/{path.name}")
+        path.unlink()
+        removed = client.get(f"/api/v1/models/{path.name}")
+
+    assert listed == [path.name]
+    assert download.content == b"model"
+    assert removed.status_code == 404
@@ -0,0 +1,197 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+GAIT_REQUEST = {
+    "ground_contact_time_ms": 310,
+    "vertical_oscillation_cm": 13,
+    "cadence_spm": 158,
+    "stride_length_m": 1.4,
+    "hip_drop_degrees": 9,
+    "avg_pace_min_per_km": 6,
+}
+
+TRAINING_REQUEST = {
+    "weekly_distance_km": 30,
+    "weekly_duration_minutes": 200,
+    "run_count": 4,
+    "avg_pace_min_per_km": 6,
+}
+
+
+def test_injury_risk_flags_every_triggered_factor():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/gait/injury-risk", json=GAIT_REQUEST)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    body = response.json()
+    assert body["risk_score"] == 0.85
+    assert body["risk_level"] == "high"
+    assert body["risk_factor_ids"] == [0, 2, 3, 4, 5]
+    assert body["recommendation_ids"] == [0, 1, 2, 3, 4]
+
+
+def test_injury_risk_reuses_warmed_kernel_signature():
+    pytest.importorskip("numba")
+    main._kernels.warmup()
+    signatures = list(main._kernels.injury_score.signatures)
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/gait/injury-risk", json=GAIT_REQUEST)
+
+    assert response.status_code == 200
+    assert main._kernels.injury_score.signatures == signatures
+
+
+def test_injury_risk_healthy_gait_has_no_factors():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/gait/injury-risk", json={
+        **GAIT_REQUEST,
+        "ground_contact_time_ms": 240,
+        "vertical_oscillation_cm": 8,
+        "cadence_spm": 180,
+        "stride_length_m": 1.1,
+        "hip_drop_degrees": 4,
+    })
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "risk_score": 0.0,
+        "risk_level": "low",
+        "risk_factor_ids": [6],
+        "recommendation_ids": [5],
+    }
+
+
+def test_catalog_resolves_injury_risk_ids():
+    client = TestClient(main.app)
+
+    catalog = client.get("/api/v1/catalog").json()
+    body = client.post("/api/v1/gait/injury-risk", json=GAIT_REQUEST).json()
+
+    assert catalog["risk_factors"][body["risk_factor_ids"][0]] == "Very low cadence increases impact forces"
+    assert catalog["recommendations"][body["recommendation_ids"][0]] == "Increase step rate by 5-10% over 4 weeks"
+
+
+def test_catalog_revalidates_with_etag():
+    client = TestClient(main.app)
+
+    etag = client.get("/api/v1/catalog").headers["etag"]
+    response = client.get("/api/v1/catalog", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_catalog_revalidates_with_weak_etag_list():
+    client = TestClient(main.app)
+    etag = client.get("/api/v1/catalog").headers["etag"]
+
+    response = client.get("/api/v1/catalog", headers={"If-None-Match": f'"stale", W/{etag}'})
+
+    assert response.status_code == 304
+
+
+def test_performance_forecast_uses_riegel_extrapolation():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/performance/forecast", json=TRAINING_REQUEST)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "predicted_5k_seconds": 1530,
+        "predicted_10k_seconds": 3189,
+        "predicted_half_marathon_seconds": 7039,
+        "predicted_marathon_seconds": 14676,
+        "confidence": 0.7,
+        "training_suggestions": ["Great training — maintain consistency!"],
+    }
+
+
+def test_training_load_reports_acwr_status():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/training/load", json=TRAINING_REQUEST)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["acute_load"] == 35.0
+    assert body["chronic_load"] == 29.8
+    assert body["acute_chronic_ratio"] == 1.18
+    assert body["training_status"] == "optimal"
+
+
+def test_training_load_low_hrv_downgrades_optimal_status():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/training/load", json={**TRAINING_REQUEST, "hrv_rmssd": 25})
+
+    assert response.status_code == 200
+    assert response.json()["training_status"] == "overreaching"
+
+
+def test_training_load_series_steady_load_is_optimal():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/training/load/series", json={"daily_load": [8.0] * 28})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["acute_load"] == 8.0
+    assert body["chronic_load"] == 8.0
+    assert body["acute_chronic_ratio"] == 1.0
+    assert body["training_status"] == "optimal"
+
+
+def test_training_load_series_spike_is_overtraining():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/training/load/series", json={
+        "daily_load": [5.0] * 21 + [20.0] * 7,
+    })
+
+    assert response.status_code == 200
+    assert response.json()["acute_chronic_ratio"] > 1.5
+    assert response.json()["training_status"] == "overtraining"
+
+
+def test_training_load_series_rejects_empty_history():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/training/load/series", json={"daily_load": []})
+
+    assert response.status_code == 422
+
+
+def test_training_load_series_rejects_negative_load():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/training/load/series", json={"daily_load": [-5, 0, 0]})
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("hip_drop", [None, 0.0, 8.0])
+def test_injury_risk_hip_drop_rule_needs_reading_above_threshold(hip_drop):
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/gait/injury-risk", json={
+        **GAIT_REQUEST,
+        "hip_drop_degrees": hip_drop,
+    })
+
+    assert response.status_code == 200
+    assert 4 not in response.json()["risk_factor_ids"]
+
+
+def test_injury_risk_rejects_missing_fields():
+    client = TestClient(main.app)
+
+    response = client.post("/api/v1/gait/injury-risk", json={"cadence_spm": 170})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body"]
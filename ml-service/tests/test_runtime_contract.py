@@ -55,3 +55,14 @@ def test_cors_origins_are_parsed_from_env(monkeypatch):
         "https://apexrun.app",
         "https://www.apexrun.app",
     ]
+
+
+def test_routes_are_registered_once():
+    routes = [
+        (route.path, method)
+        for route in main.app.routes
+        for method in getattr(route, "methods", ())
+    ]
+
+    assert len(routes) == len(set(routes))
+    assert ("/api/v1/inference", "POST") in routes
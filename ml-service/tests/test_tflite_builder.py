@@ -0,0 +1,194 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+
+import _builder_kernels
+import tflite_builder
+
+
+@pytest.fixture
+def models_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(tflite_builder, "MODELS_DIR", tmp_path)
+    monkeypatch.setattr(tflite_builder, "MODEL_SPECS", tflite_builder.MODEL_SPECS[1:])
+    return tmp_path
+
+
+def test_build_all_models_reuses_unchanged_artifacts(models_dir, monkeypatch):
+    first = tflite_builder.build_all_models(epochs=1)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("model was retrained")
+
+    monkeypatch.setattr(tflite_builder, "train_model", fail)
+    second = tflite_builder.build_all_models(epochs=1)
+
+    assert second == first
+    assert (models_dir / "performance_model.tflite.sha").exists()
+
+
+def test_build_all_models_regenerates_missing_legacy_json(models_dir):
+    tflite_builder.build_all_models(epochs=1)
+    (models_dir / "injury_risk_norm_params.json").unlink()
+
+    tflite_builder.build_all_models(epochs=1)
+
+    assert (models_dir / "injury_risk_norm_params.json").exists()
+
+
+def test_build_all_models_force_retrains(models_dir, monkeypatch):
+    tflite_builder.build_all_models(epochs=1)
+    trained = []
+    train_model = tflite_builder.train_model
+    monkeypatch.setattr(
+        tflite_builder, "train_model",
+        lambda *args, **kwargs: trained.append(1) or train_model(*args, **kwargs),
+    )
+
+    tflite_builder.build_all_models(epochs=1, force=True)
+
+    assert trained == [1, 1]
+
+
+def test_build_key_hashes_builder_kernels_not_serving_kernels():
+    sources = {source.name for source in tflite_builder._BUILD_SOURCES}
+
+    assert "_builder_kernels.py" in sources
+    assert "_kernels.py" not in sources
+
+
+def test_run_tflite_inference_batch_matches_single_rows():
+    model_path = str(tflite_builder.MODELS_DIR / "injury_risk_model.tflite")
+    rows = np.random.default_rng(0).standard_normal((16, 7)).astype(np.float32)
+
+    batch = tflite_builder.run_tflite_inference(model_path, rows)
+    singles = np.concatenate([tflite_builder.run_tflite_inference(model_path, row) for row in rows])
+
+    assert batch.shape == (16, 3)
+    np.testing.assert_array_equal(batch, singles)
+
+
+def _numpy_gait_score(X):
+    gct, osc, cadence, stride, lean, hip_drop, arm_sym, _pace = X.T
+    return (
+        30 * np.clip((cadence - 140) / 60, 0, 1)
+        + 20 * np.clip((300 - gct) / 120, 0, 1)
+        + 15 * np.clip((12 - osc) / 7, 0, 1)
+        + 10 * np.clip((10 - hip_drop) / 8, 0, 1)
+        + 10 * np.clip((arm_sym - 70) / 30, 0, 1)
+        + 10 * np.clip((10 - lean) / 8, 0, 1)
+        + 5 * np.clip((1.3 - stride) / 0.6, 0, 1)
+    )
+
+
+def _numpy_injury_risk(X):
+    gct, osc, cadence, stride, hip_drop, weekly_km, acwr = X.T
+    return (
+        0.15 * np.clip((gct - 250) / 100, 0, 1)
+        + 0.15 * np.clip((osc - 10) / 5, 0, 1)
+        + 0.15 * np.clip((170 - cadence) / 30, 0, 1)
+        + 0.1 * np.clip((stride - 1.1) / 0.4, 0, 1)
+        + 0.15 * np.clip((hip_drop - 6) / 6, 0, 1)
+        + 0.1 * np.clip((weekly_km - 60) / 60, 0, 1)
+        + 0.2 * np.clip((acwr - 1.3) / 0.7, 0, 1)
+    )
+
+
+def _numpy_5k_seconds(X):
+    weekly_km, pace, runs_per_week, _longest_run, rhr, hrv = X.T
+    return (
+        pace * (5 * 60 * 0.88)
+        - np.clip((weekly_km - 30) / 70, 0, 1) * 120
+        - np.clip((70 - rhr) / 30, 0, 1) * 90
+        - np.clip((hrv - 40) / 60, 0, 1) * 60
+        - np.clip((runs_per_week - 3) / 4, 0, 1) * 45
+    )
+
+
+@pytest.mark.parametrize("kernel, ranges, expected", [
+    (_builder_kernels.synthetic_gait_score, tflite_builder.GAIT_FEATURE_RANGES, _numpy_gait_score),
+    (_builder_kernels.synthetic_injury_risk, tflite_builder.INJURY_FEATURE_RANGES, _numpy_injury_risk),
+    (_builder_kernels.synthetic_5k_seconds, tflite_builder.PERFORMANCE_FEATURE_RANGES, _numpy_5k_seconds),
+])
+def test_synthetic_target_kernels_match_numpy(kernel, ranges, expected):
+    X = tflite_builder._uniform_features(np.random.default_rng(0), 2000, ranges)
+
+    np.testing.assert_allclose(kernel(X), expected(X.astype(np.float64)), rtol=0, atol=1e-3)
+
+
+def test_run_tflite_inference_matches_server_inference():
+    import main
+
+    raw = [[250, 10, 170, 1.1, 6, 40, 1.2], [330, 14, 150, 1.4, 11, 100, 1.9]]
+    with np.load(tflite_builder.MODELS_DIR / "injury_risk_norm_params.npz") as norm:
+        standardized = (np.asarray(raw, dtype=np.float32) - norm["mean"]) * (1 / norm["std"])
+
+    validated = tflite_builder.run_tflite_inference(
+        str(tflite_builder.MODELS_DIR / "injury_risk_model.tflite"), standardized,
+    )
+
+    np.testing.assert_allclose(validated, main._invoke_interpreter("injury_risk_model.tflite", raw), atol=1e-6)
+
+
+def test_injury_labels_use_inclusive_lower_thresholds():
+    risk = np.array([0.0, 0.2999, 0.3, 0.5999, 0.6, 1.0], dtype=np.float32)
+
+    labels = np.digitize(risk, tflite_builder._RISK_THRESHOLDS)
+
+    assert labels.tolist() == [0, 0, 1, 1, 2, 2]
+    _, y = tflite_builder.generate_injury_risk_data(500)
+    assert y.dtype == np.int32 and set(y.tolist()) <= {0, 1, 2}
+
+
+def test_normalization_params_are_saved_as_npz(models_dir):
+    X = np.random.default_rng(0).random((100, 3), dtype=np.float32)
+
+    params = tflite_builder.export_normalization_params(X, "demo")
+
+    assert not (models_dir / "demo_norm_params.json").exists()
+    with np.load(models_dir / "demo_norm_params.npz") as saved:
+        assert saved["mean"].dtype == np.float32
+        assert saved["std"].tolist() == params["std"]
+    np.testing.assert_allclose(params["mean"], X.mean(axis=0), rtol=1e-6)
+    np.testing.assert_allclose(params["std"], X.std(axis=0), rtol=1e-5)
+
+
+def test_export_metadata_from_keras_matches_interpreter(models_dir):
+    X, y = tflite_builder.generate_performance_data(200)
+    model, Z = tflite_builder._deployment_graph(tflite_builder.build_performance_model(X, y), X)
+    path = str(models_dir / "performance_model.tflite")
+
+    from_keras = tflite_builder.export_tflite(model, path, Z)
+    verified = tflite_builder.export_tflite(model, path, Z, verify=True)
+
+    assert from_keras == verified
+
+
+@pytest.mark.parametrize("generate", [
+    tflite_builder.generate_gait_training_data,
+    tflite_builder.generate_injury_risk_data,
+    tflite_builder.generate_performance_data,
+])
+def test_generators_are_seeded_without_global_state(generate):
+    np.random.seed(0)
+    before = np.random.random()
+    np.random.seed(0)
+
+    X, y = generate(100)
+    X_again, y_again = generate(100)
+    X_other, _ = generate(100, seed=7)
+
+    assert np.random.random() == before
+    assert X.dtype == np.float32
+    np.testing.assert_array_equal(X, X_again)
+    np.testing.assert_array_equal(y, y_again)
+    assert not np.array_equal(X, X_other)
+
+
+def test_build_all_models_without_export_saves_keras_models(models_dir):
+    results = tflite_builder.build_all_models(epochs=1, export=False)
+
+    assert set(results) == {"injury_risk", "performance"}
+    assert results["performance"]["path"] == str(models_dir / "performance_model.keras")
+    assert results["performance"]["input_shape"] == [1, 6]
+    assert not list(models_dir.glob("*.tflite"))
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("tensorflow")
+
+import _tflite_runtime
+import main
+
+MODEL_PATH = str(main.MODELS_DIR / "injury_risk_model.tflite")
+ROWS = [[250, 10, 170, 1.1, 6, 40, 1.2], [330, 14, 150, 1.4, 11, 100, 1.9]]
+
+
+def test_invoke_reuses_scratch_buffer_for_steady_batch_shape():
+    pooled = _tflite_runtime.load_interpreter(MODEL_PATH)
+    _tflite_runtime.invoke(pooled, ROWS)
+    scratch = pooled.scratch
+
+    _tflite_runtime.invoke(pooled, ROWS[::-1])
+
+    assert pooled.scratch is scratch
+
+
+def test_invoke_quantizes_like_set_tensor():
+    pooled = _tflite_runtime.load_interpreter(MODEL_PATH)
+    with np.load(main.MODELS_DIR / "injury_risk_norm_params.npz") as norm:
+        mean, inv_std = norm["mean"], 1 / norm["std"]
+    interpreter = _tflite_runtime.load_interpreter(MODEL_PATH).interp
+    interpreter.resize_tensor_input(pooled.in_idx, (len(ROWS), len(ROWS[0])), strict=True)
+    interpreter.allocate_tensors()
+    scale, zero = pooled.in_quant
+    features = (np.asarray(ROWS, dtype=np.float32) - mean) * inv_std
+    interpreter.set_tensor(pooled.in_idx, np.clip(np.round(features / scale + zero), -128, 127).astype(np.int8))
+    interpreter.invoke()
+    out_scale, out_zero = pooled.out_quant
+    expected = (interpreter.get_tensor(pooled.out_idx).astype(np.float32) - out_zero) * out_scale
+
+    np.testing.assert_array_equal(_tflite_runtime.invoke(pooled, ROWS, mean, inv_std), expected)
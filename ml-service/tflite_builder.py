@@ -9,12 +9,20 @@ Builds, trains, and exports TensorFlow Lite models for on-device inference:
 All models are quantized for mobile deployment (int8/float16).
 """
 
+import functools
+import hashlib
+import json
+import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import tensorflow as tf
 from pathlib import Path
 from typing import Tuple, Optional
 
+import _builder_kernels
+import _tflite_runtime
+
 # Output directory for exported .tflite files
 MODELS_DIR = Path(__file__).parent / "models"
 MODELS_DIR.mkdir(exist_ok=True)
@@ -24,11 +32,62 @@ MODELS_DIR.mkdir(exist_ok=True)
 # Synthetic Training Data Generators
 # ================================================================
 
-def generate_gait_training_data(n_samples: int = 5000) -> Tuple[np.ndarray, np.ndarray]:
+# Each generator draws from its own default_rng(seed) and never touches
+# NumPy's global RNG state, so they are reproducible and safe on any thread.
+
+# Per-feature uniform sampling ranges (lo, hi), in feature-column order
+GAIT_FEATURE_RANGES = np.array([
+    (180, 350),   # ground_contact_time_ms
+    (5, 15),      # vertical_oscillation_cm
+    (140, 200),   # cadence_spm
+    (0.7, 1.5),   # stride_length_m
+    (2, 15),      # forward_lean_degrees
+    (2, 12),      # hip_drop_degrees
+    (70, 100),    # arm_swing_symmetry_pct
+    (3.5, 8.0),   # avg_pace_min_per_km
+], dtype=np.float32)
+
+INJURY_FEATURE_RANGES = np.array([
+    (180, 350),   # ground_contact_time_ms
+    (5, 15),      # vertical_oscillation_cm
+    (140, 200),   # cadence_spm
+    (0.7, 1.5),   # stride_length_m
+    (2, 12),      # hip_drop_degrees
+    (5, 120),     # weekly_distance_km
+    (0.5, 2.0),   # acute_chronic_ratio
+], dtype=np.float32)
+
+PERFORMANCE_FEATURE_RANGES = np.array([
+    (10, 100),    # weekly_distance_km
+    (3.5, 8.0),   # avg_pace_min_per_km
+    (2, 7),       # run_count_per_week
+    (3, 30),      # longest_run_km
+    (40, 80),     # resting_heart_rate
+    (20, 100),    # hrv_rmssd
+], dtype=np.float32)
+
+
+def _uniform_features(rng: np.random.Generator, n_samples: int, ranges: np.ndarray) -> np.ndarray:
+    """Draw an (n_samples, F) float32 feature matrix in one pass, scaled in place."""
+    lo = ranges[:, 0]
+    X = rng.random((n_samples, len(ranges)), dtype=np.float32)
+    X *= ranges[:, 1] - lo
+    X += lo
+    return X
+
+
+def _add_noise(rng: np.random.Generator, target: np.ndarray, sigma: float) -> None:
+    """Add N(0, sigma²) noise to a float32 target in place, with one scratch draw."""
+    noise = rng.standard_normal(target.shape[0], dtype=np.float32)
+    noise *= sigma
+    target += noise
+
+
+def generate_gait_training_data(n_samples: int = 5000, seed: int = 42) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate synthetic gait biomechanics data for form score prediction.
 
-    Features (8):
+    Features (8): see ``GAIT_FEATURE_RANGES``
         0: ground_contact_time_ms   (180-350)
         1: vertical_oscillation_cm  (5-15)
         2: cadence_spm              (140-200)
@@ -40,40 +99,26 @@ def generate_gait_training_data(n_samples: int = 5000) -> Tuple[np.ndarray, np.n
 
     Labels: form_score (0-100)
     """
-    np.random.seed(42)
-
-    gct = np.random.uniform(180, 350, n_samples)
-    osc = np.random.uniform(5, 15, n_samples)
-    cadence = np.random.uniform(140, 200, n_samples)
-    stride = np.random.uniform(0.7, 1.5, n_samples)
-    lean = np.random.uniform(2, 15, n_samples)
-    hip_drop = np.random.uniform(2, 12, n_samples)
-    arm_sym = np.random.uniform(70, 100, n_samples)
-    pace = np.random.uniform(3.5, 8.0, n_samples)
+    rng = np.random.default_rng(seed)
+    X = _uniform_features(rng, n_samples, GAIT_FEATURE_RANGES)
 
     # Form score heuristic (higher is better)
-    score = (
-        30 * np.clip((cadence - 140) / 60, 0, 1)            # Higher cadence = better
-        + 20 * np.clip((300 - gct) / 120, 0, 1)             # Lower GCT = better
-        + 15 * np.clip((12 - osc) / 7, 0, 1)                # Lower oscillation = better
-        + 10 * np.clip((10 - hip_drop) / 8, 0, 1)           # Lower hip drop = better
-        + 10 * np.clip((arm_sym - 70) / 30, 0, 1)           # Higher symmetry = better
-        + 10 * np.clip((10 - lean) / 8, 0, 1)               # Moderate lean = better
-        + 5  * np.clip((1.3 - stride) / 0.6, 0, 1)          # Moderate stride = better
-    )
-    score = np.clip(score + np.random.normal(0, 3, n_samples), 0, 100)
-
-    X = np.column_stack([gct, osc, cadence, stride, lean, hip_drop, arm_sym, pace]).astype(np.float32)
-    y = score.astype(np.float32)
+    score = _builder_kernels.synthetic_gait_score(X)
+    _add_noise(rng, score, 3)
+    y = np.clip(score, 0, 100, out=score)
 
     return X, y
 
 
-def generate_injury_risk_data(n_samples: int = 5000) -> Tuple[np.ndarray, np.ndarray]:
+# Lower bounds of the moderate / high classes (np.digitize: bins[i-1] <= x < bins[i])
+_RISK_THRESHOLDS = np.array([0.3, 0.6], dtype=np.float32)
+
+
+def generate_injury_risk_data(n_samples: int = 5000, seed: int = 43) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate synthetic data for injury risk classification.
 
-    Features (7):
+    Features (7): see ``INJURY_FEATURE_RANGES``
         0: ground_contact_time_ms
         1: vertical_oscillation_cm
         2: cadence_spm
@@ -84,44 +129,25 @@ def generate_injury_risk_data(n_samples: int = 5000) -> Tuple[np.ndarray, np.nda
 
     Labels: risk_level (0=low, 1=moderate, 2=high)
     """
-    np.random.seed(43)
-
-    gct = np.random.uniform(180, 350, n_samples)
-    osc = np.random.uniform(5, 15, n_samples)
-    cadence = np.random.uniform(140, 200, n_samples)
-    stride = np.random.uniform(0.7, 1.5, n_samples)
-    hip_drop = np.random.uniform(2, 12, n_samples)
-    weekly_km = np.random.uniform(5, 120, n_samples)
-    acwr = np.random.uniform(0.5, 2.0, n_samples)
+    rng = np.random.default_rng(seed)
+    X = _uniform_features(rng, n_samples, INJURY_FEATURE_RANGES)
 
     # Risk score based on biomechanics + training load
-    risk = (
-        0.15 * np.clip((gct - 250) / 100, 0, 1)
-        + 0.15 * np.clip((osc - 10) / 5, 0, 1)
-        + 0.15 * np.clip((170 - cadence) / 30, 0, 1)
-        + 0.1  * np.clip((stride - 1.1) / 0.4, 0, 1)
-        + 0.15 * np.clip((hip_drop - 6) / 6, 0, 1)
-        + 0.1  * np.clip((weekly_km - 60) / 60, 0, 1)
-        + 0.2  * np.clip((acwr - 1.3) / 0.7, 0, 1)
-    )
-    risk += np.random.normal(0, 0.05, n_samples)
-    risk = np.clip(risk, 0, 1)
-
-    # Convert to classes
-    labels = np.zeros(n_samples, dtype=np.int32)
-    labels[risk >= 0.3] = 1  # moderate
-    labels[risk >= 0.6] = 2  # high
+    risk = _builder_kernels.synthetic_injury_risk(X)
+    _add_noise(rng, risk, 0.05)
+    risk = np.clip(risk, 0, 1, out=risk)
 
-    X = np.column_stack([gct, osc, cadence, stride, hip_drop, weekly_km, acwr]).astype(np.float32)
+    # Convert to classes: < 0.3 low, [0.3, 0.6) moderate, >= 0.6 high
+    labels = np.digitize(risk, _RISK_THRESHOLDS).astype(np.int32, copy=False)
 
     return X, labels
 
 
-def generate_performance_data(n_samples: int = 5000) -> Tuple[np.ndarray, np.ndarray]:
+def generate_performance_data(n_samples: int = 5000, seed: int = 44) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate synthetic training data for race time prediction.
 
-    Features (6):
+    Features (6): see ``PERFORMANCE_FEATURE_RANGES``
         0: weekly_distance_km
         1: avg_pace_min_per_km
         2: run_count_per_week
@@ -131,30 +157,13 @@ def generate_performance_data(n_samples: int = 5000) -> Tuple[np.ndarray, np.nda
 
     Labels: predicted_5k_seconds
     """
-    np.random.seed(44)
-
-    weekly_km = np.random.uniform(10, 100, n_samples)
-    pace = np.random.uniform(3.5, 8.0, n_samples)
-    runs_per_week = np.random.uniform(2, 7, n_samples)
-    longest_run = np.random.uniform(3, 30, n_samples)
-    rhr = np.random.uniform(40, 80, n_samples)
-    hrv = np.random.uniform(20, 100, n_samples)
-
-    # 5K time estimation (seconds)
-    base_5k = pace * 5 * 60 * 0.88  # Race pace ~12% faster than training
-
-    # Adjustments
-    volume_adj = -np.clip((weekly_km - 30) / 70, 0, 1) * 120  # More volume = faster
-    fitness_adj = -np.clip((70 - rhr) / 30, 0, 1) * 90         # Lower RHR = faster
-    hrv_adj = -np.clip((hrv - 40) / 60, 0, 1) * 60             # Higher HRV = faster
-    consistency_adj = -np.clip((runs_per_week - 3) / 4, 0, 1) * 45
+    rng = np.random.default_rng(seed)
+    X = _uniform_features(rng, n_samples, PERFORMANCE_FEATURE_RANGES)
 
-    t_5k = base_5k + volume_adj + fitness_adj + hrv_adj + consistency_adj
-    t_5k += np.random.normal(0, 30, n_samples)
-    t_5k = np.clip(t_5k, 720, 2400)  # 12min to 40min range
-
-    X = np.column_stack([weekly_km, pace, runs_per_week, longest_run, rhr, hrv]).astype(np.float32)
-    y = t_5k.astype(np.float32)
+    # 5K time estimation (seconds): training pace plus volume/fitness adjustments
+    t_5k = _builder_kernels.synthetic_5k_seconds(X)
+    _add_noise(rng, t_5k, 30)
+    y = np.clip(t_5k, 720, 2400, out=t_5k)  # 12min to 40min range
 
     return X, y
 
@@ -163,59 +172,107 @@ def generate_performance_data(n_samples: int = 5000) -> Tuple[np.ndarray, np.nda
 # Model Builders
 # ================================================================
 
-def build_gait_model() -> tf.keras.Model:
+# Peak Adam step size for train_model's batch_size=256 and 15-epoch cosine
+# decay; lower peaks leave the 5K regression short of converging in that
+# budget. XLA stays at Keras' "auto", i.e. accelerators only — on CPU it
+# made these tiny steps slower.
+LEARNING_RATE = 2e-2
+
+
+def _feature_moments(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-column (mean, variance) of X in one pass, accumulated in float64.
+
+    Sum and sum of squares come from a single read each, with no
+    ``X - mean`` temporary like ``np.var`` makes; float64 accumulation
+    keeps the ``E[x^2] - E[x]^2`` cancellation harmless at these ranges.
+    """
+    n = X.shape[0]
+    mean = X.sum(axis=0, dtype=np.float64) / n
+    var = np.einsum("ij,ij->j", X, X, dtype=np.float64) / n - mean * mean
+    return mean, np.maximum(var, 1e-12)
+
+
+def _input_normalization(X_train: np.ndarray) -> tf.keras.layers.Layer:
+    """
+    Frozen (x - mean) / std layer from training-set statistics.
+
+    Stands in for a leading BatchNormalization: the tabular inputs are
+    static, so moving-stat updates buy nothing, and the converted graph is
+    a plain sub/mul ahead of the first Dense.
+    """
+    mean, var = _feature_moments(X_train)
+    return tf.keras.layers.Normalization(axis=-1, mean=mean, variance=var)
+
+
+def _output_bias(value) -> tf.keras.initializers.Initializer:
+    """
+    Constant output-layer bias: the target mean, or log priors for classes.
+
+    Without BatchNormalization's learnable shift, the unscaled regression
+    targets (e.g. ~1500 s for 5K) otherwise take most of training to reach.
+    """
+    return tf.keras.initializers.Constant(np.asarray(value, dtype=np.float32))
+
+
+def build_gait_model(X_train: np.ndarray, y_train: np.ndarray) -> tf.keras.Model:
     """Build a lightweight MLP for gait form scoring (regression)."""
     model = tf.keras.Sequential([
         tf.keras.layers.Input(shape=(8,), name="gait_input"),
-        tf.keras.layers.BatchNormalization(),
+        _input_normalization(X_train),
         tf.keras.layers.Dense(32, activation="relu"),
         tf.keras.layers.Dropout(0.2),
         tf.keras.layers.Dense(16, activation="relu"),
         tf.keras.layers.Dropout(0.1),
-        tf.keras.layers.Dense(1, name="form_score"),
+        tf.keras.layers.Dense(1, name="form_score", bias_initializer=_output_bias(y_train.mean())),
     ], name="gait_form_model")
 
     model.compile(
-        optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
+        optimizer=tf.keras.optimizers.Adam(learning_rate=LEARNING_RATE),
         loss="mse",
         metrics=["mae"],
     )
     return model
 
 
-def build_injury_model() -> tf.keras.Model:
+def build_injury_model(X_train: np.ndarray, y_train: np.ndarray) -> tf.keras.Model:
     """Build a classifier for injury risk (3 classes: low/moderate/high)."""
     model = tf.keras.Sequential([
         tf.keras.layers.Input(shape=(7,), name="injury_input"),
-        tf.keras.layers.BatchNormalization(),
+        _input_normalization(X_train),
         tf.keras.layers.Dense(32, activation="relu"),
         tf.keras.layers.Dropout(0.3),
         tf.keras.layers.Dense(16, activation="relu"),
         tf.keras.layers.Dropout(0.2),
-        tf.keras.layers.Dense(3, activation="softmax", name="risk_level"),
+        tf.keras.layers.Dense(
+            3, activation="softmax", name="risk_level",
+            bias_initializer=_output_bias(np.log(np.maximum(np.bincount(y_train, minlength=3), 1) / len(y_train))),
+        ),
     ], name="injury_risk_model")
 
     model.compile(
-        optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
+        optimizer=tf.keras.optimizers.Adam(learning_rate=LEARNING_RATE),
         loss="sparse_categorical_crossentropy",
         metrics=["accuracy"],
     )
     return model
 
 
-def build_performance_model() -> tf.keras.Model:
+def build_performance_model(X_train: np.ndarray, y_train: np.ndarray) -> tf.keras.Model:
     """Build a regression model for race time prediction."""
     model = tf.keras.Sequential([
         tf.keras.layers.Input(shape=(6,), name="perf_input"),
-        tf.keras.layers.BatchNormalization(),
+        _input_normalization(X_train),
         tf.keras.layers.Dense(32, activation="relu"),
         tf.keras.layers.Dropout(0.2),
         tf.keras.layers.Dense(16, activation="relu"),
-        tf.keras.layers.Dense(1, name="predicted_5k_seconds"),
+        tf.keras.layers.Dense(
+            1, name="predicted_5k_seconds", bias_initializer=_output_bias(y_train.mean()),
+        ),
     ], name="performance_model")
 
     model.compile(
-        optimizer=tf.keras.optimizers.Adam(learning_rate=0.001),
+        optimizer=tf.keras.optimizers.Adam(learning_rate=LEARNING_RATE),
         loss="mse",
         metrics=["mae"],
     )
@@ -230,31 +287,49 @@ def train_model(
     model: tf.keras.Model,
     X_train: np.ndarray,
     y_train: np.ndarray,
-    epochs: int = 50,
-    batch_size: int = 32,
+    epochs: int = 15,
+    batch_size: int = 256,
     validation_split: float = 0.2,
 ) -> tf.keras.callbacks.History:
-    """Train a Keras model with early stopping."""
+    """Train a Keras model on a cosine learning-rate decay with early stopping."""
+    initial_lr = float(model.optimizer.learning_rate)
     callbacks = [
         tf.keras.callbacks.EarlyStopping(
-            patience=10,
+            patience=5,
             restore_best_weights=True,
             monitor="val_loss",
         ),
-        tf.keras.callbacks.ReduceLROnPlateau(
-            factor=0.5,
-            patience=5,
-            min_lr=1e-6,
+        # Anneal from the compiled rate towards 0 over the epoch budget
+        tf.keras.callbacks.LearningRateScheduler(
+            lambda epoch: initial_lr * 0.5 * (1 + math.cos(math.pi * epoch / epochs)),
         ),
     ]
 
+    # Hold out the tail like Keras' validation_split, but feed both parts
+    # through cached, prefetched tf.data pipelines instead of per-step
+    # numpy slicing on the Python thread
+    n_train = len(X_train) - int(len(X_train) * validation_split)
+    train_ds = (
+        tf.data.Dataset.from_tensor_slices((X_train[:n_train], y_train[:n_train]))
+        .cache()
+        .shuffle(n_train)
+        .batch(batch_size)
+        .prefetch(tf.data.AUTOTUNE)
+    )
+    val_ds = (
+        tf.data.Dataset.from_tensor_slices((X_train[n_train:], y_train[n_train:]))
+        .batch(batch_size)
+        .cache()
+        .prefetch(tf.data.AUTOTUNE)
+    )
+
     history = model.fit(
-        X_train, y_train,
+        train_ds,
         epochs=epochs,
-        batch_size=batch_size,
-        validation_split=validation_split,
+        validation_data=val_ds,
         callbacks=callbacks,
-        verbose=1,
+        shuffle=False,  # train_ds already shuffles; Keras ignores (and warns about) shuffle for datasets
+        verbose=2,  # one line per epoch; a live progress bar costs more than these steps
     )
     return history
 
@@ -263,11 +338,41 @@ def train_model(
 # TFLite Export with Quantization
 # ================================================================
 
+def _deployment_graph(model: tf.keras.Model, X: np.ndarray) -> Tuple[tf.keras.Model, np.ndarray]:
+    """
+    Split off a trained model's leading Normalization layer for export.
+
+    Returns the remaining layers as a model taking standardized features
+    ((x - mean) / std, as in the norm params the app already applies), plus
+    ``X`` standardized for int8 calibration. Raw features span 0.5 to 350,
+    which one per-tensor int8 input scale cannot resolve; z-scores can.
+    This also leaves FULLY_CONNECTED as the graph's first op, so folding
+    mean/std into the first Dense (raw inputs again) is deliberately avoided.
+    """
+    normalize = model.layers[0]
+    deployed = tf.keras.Sequential(
+        [tf.keras.layers.Input(shape=model.input_shape[1:])] + model.layers[1:],
+        name=model.name,
+    )
+    Z = np.asarray(normalize(X))
+
+    # The split must not change predictions; check on a slice before export
+    check = slice(0, 256)
+    if not np.allclose(deployed(Z[check]), model(X[check]), rtol=1e-5, atol=1e-4):
+        raise ValueError(f"{model.name}: deployment graph diverges from the trained model")
+    return deployed, Z
+
+
+# Rows of representative_data used to calibrate int8 activation ranges
+CALIBRATION_SAMPLES = 2000
+
+
 def export_tflite(
     model: tf.keras.Model,
     output_path: str,
     representative_data: Optional[np.ndarray] = None,
     quantize: str = "float16",
+    verify: bool = False,
 ) -> dict:
     """
     Export a Keras model to TFLite with optional quantization.
@@ -277,6 +382,7 @@ def export_tflite(
         output_path: Path for .tflite file
         representative_data: Sample data for full integer quantization
         quantize: "none", "float16", "int8", or "dynamic"
+        verify: Load and allocate the exported model as a sanity check
 
     Returns:
         dict with model metadata (size, input/output shapes)
@@ -288,42 +394,90 @@ def export_tflite(
         converter.target_spec.supported_types = [tf.float16]
     elif quantize == "dynamic":
         converter.optimizations = [tf.lite.Optimize.DEFAULT]
-    elif quantize == "int8" and representative_data is not None:
+    elif quantize == "int8":
+        if representative_data is None:
+            raise ValueError("int8 quantization requires representative_data for calibration")
+
+        # Full-integer post-training quantization: int8 weights, activations and I/O
         converter.optimizations = [tf.lite.Optimize.DEFAULT]
         converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
 
+        calibration = np.ascontiguousarray(representative_data[:CALIBRATION_SAMPLES], dtype=np.float32)
+
         def representative_dataset():
-            for i in range(min(200, len(representative_data))):
-                yield [representative_data[i:i+1]]
+            # The calibrator copies each sample before asking for the next, so
+            # one (1, F) buffer is refilled rather than allocating per row
+            sample = np.empty((1, calibration.shape[1]), dtype=np.float32)
+            for row in calibration:
+                sample[0] = row
+                yield [sample]
 
         converter.representative_dataset = representative_dataset
-        converter.inference_input_type = tf.uint8
-        converter.inference_output_type = tf.uint8
+        converter.inference_input_type = tf.int8
+        converter.inference_output_type = tf.int8
 
     tflite_model = converter.convert()
 
-    # Save
+    # Save via rename so interpreters that mmap the old file keep a valid
+    # mapping; rewriting in place would change pages under them
     Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "wb") as f:
+    tmp_path = f"{output_path}.tmp"
+    with open(tmp_path, "wb") as f:
         f.write(tflite_model)
+    os.replace(tmp_path, output_path)
+
+    if quantize == "int8" or verify:
+        # I/O quantization params only exist in the converted flatbuffer
+        return read_tflite_metadata(output_path, quantize, allocate=verify)
+
+    # Float I/O: shapes and dtypes are exactly the Keras model's
+    return keras_metadata(model, output_path, quantize)
+
+
+def keras_metadata(model: tf.keras.Model, path: str, quantize: str = "none") -> dict:
+    """Export-style metadata for a float model saved at ``path``, read from Keras."""
+    size_bytes = os.path.getsize(path)
+    return {
+        "path": path,
+        "size_bytes": size_bytes,
+        "size_kb": round(size_bytes / 1024, 1),
+        "quantization": quantize,
+        "input_shape": [d or 1 for d in model.inputs[0].shape],
+        "input_dtype": str(np.dtype(model.inputs[0].dtype).type),
+        "output_shape": [d or 1 for d in model.outputs[0].shape],
+        "output_dtype": str(np.dtype(model.outputs[0].dtype).type),
+    }
+
+
+def read_tflite_metadata(model_path: str, quantize: str, allocate: bool = False) -> dict:
+    """
+    Read size and input/output tensor metadata from an exported .tflite file.
 
-    # Get metadata
-    interpreter = tf.lite.Interpreter(model_content=tflite_model)
-    interpreter.allocate_tensors()
+    Tensor details are available straight from the flatbuffer; ``allocate``
+    also allocates the tensors, to check the model is actually loadable.
+    """
+    interpreter = tf.lite.Interpreter(model_path=model_path)
+    if allocate:
+        interpreter.allocate_tensors()
 
     input_details = interpreter.get_input_details()
     output_details = interpreter.get_output_details()
+    size_bytes = os.path.getsize(model_path)
 
     metadata = {
-        "path": output_path,
-        "size_bytes": len(tflite_model),
-        "size_kb": round(len(tflite_model) / 1024, 1),
+        "path": model_path,
+        "size_bytes": size_bytes,
+        "size_kb": round(size_bytes / 1024, 1),
         "quantization": quantize,
         "input_shape": input_details[0]["shape"].tolist(),
         "input_dtype": str(input_details[0]["dtype"]),
         "output_shape": output_details[0]["shape"].tolist(),
         "output_dtype": str(output_details[0]["dtype"]),
     }
+    if quantize == "int8":
+        # (scale, zero_point) pairs so clients can (de)quantize I/O themselves
+        metadata["input_quantization"] = list(map(float, input_details[0]["quantization"]))
+        metadata["output_quantization"] = list(map(float, output_details[0]["quantization"]))
 
     return metadata
 
@@ -332,51 +486,58 @@ def export_tflite(
 # TFLite Inference (for testing)
 # ================================================================
 
-def run_tflite_inference(model_path: str, input_data: np.ndarray) -> np.ndarray:
-    """Run inference on a TFLite model for validation."""
-    interpreter = tf.lite.Interpreter(model_path=model_path)
-    interpreter.allocate_tensors()
+@functools.lru_cache(maxsize=8)
+def _cached_interpreter(model_path: str, mtime_ns: int) -> _tflite_runtime.PooledInterpreter:
+    """Load an interpreter once per file version; ``mtime_ns`` keys out replaced files."""
+    return _tflite_runtime.load_interpreter(model_path)
 
-    input_details = interpreter.get_input_details()
-    output_details = interpreter.get_output_details()
 
-    # Handle quantized inputs
-    input_dtype = input_details[0]["dtype"]
-    if input_dtype == np.uint8:
-        input_scale, input_zero = input_details[0]["quantization"]
-        input_data = (input_data / input_scale + input_zero).astype(np.uint8)
-    else:
-        input_data = input_data.astype(np.float32)
-
-    interpreter.set_tensor(input_details[0]["index"], input_data.reshape(1, -1))
-    interpreter.invoke()
-
-    output = interpreter.get_tensor(output_details[0]["index"])
-
-    # Dequantize output
-    output_dtype = output_details[0]["dtype"]
-    if output_dtype == np.uint8:
-        output_scale, output_zero = output_details[0]["quantization"]
-        output = (output.astype(np.float32) - output_zero) * output_scale
+def run_tflite_inference(model_path: str, input_data: np.ndarray) -> np.ndarray:
+    """
+    Run inference on a TFLite model for validation.
 
-    return output
+    Accepts a single standardized feature vector (F,) or a batch (N, F); a
+    batch is run with one invoke. The interpreter is cached per model file
+    and shares the server's resize and int8 (de)quantization logic.
+    """
+    pooled = _cached_interpreter(model_path, os.stat(model_path).st_mtime_ns)
+    return _tflite_runtime.invoke(pooled, input_data.reshape(-1, input_data.shape[-1]))
 
 
 # ================================================================
 # Normalization Data Export (for on-device use)
 # ================================================================
 
-def export_normalization_params(X: np.ndarray, name: str) -> dict:
-    """Export mean/std for feature normalization on device."""
+def export_normalization_params(
+    X: np.ndarray,
+    name: str,
+    metadata: Optional[dict] = None,
+    legacy: bool = False,
+) -> dict:
+    """
+    Export mean/std for feature normalization on device.
+
+    Saved as ``{name}_norm_params.npz`` (float32 arrays, loaded without any
+    text parsing); ``legacy=True`` also writes the ``_norm_params.json`` that
+    current app builds download. For int8 models, the input/output
+    (scale, zero_point) from the export metadata are stored too, so server
+    and client quantize identically.
+    """
+    mean, var = _feature_moments(X)
     params = {
-        "mean": X.mean(axis=0).tolist(),
-        "std": X.std(axis=0).tolist(),
+        "mean": mean.astype(np.float32),
+        "std": np.sqrt(var).astype(np.float32),
     }
+    for key in ("input_quantization", "output_quantization"):
+        if metadata and key in metadata:
+            params[key] = np.asarray(metadata[key])
+
+    np.savez(MODELS_DIR / f"{name}_norm_params.npz", **params)
 
-    import json
-    path = str(MODELS_DIR / f"{name}_norm_params.json")
-    with open(path, "w") as f:
-        json.dump(params, f, indent=2)
+    params = {key: value.tolist() for key, value in params.items()}
+    if legacy:
+        with open(MODELS_DIR / f"{name}_norm_params.json", "w") as f:
+            json.dump(params, f, indent=2)
 
     return params
 
@@ -385,52 +546,102 @@ def export_normalization_params(X: np.ndarray, name: str) -> dict:
 # Build All Models
 # ================================================================
 
-def build_all_models(epochs: int = 50) -> dict:
+# (name, title, data generator, model builder) in build order
+MODEL_SPECS = (
+    ("gait_form", "Gait Form Analysis", generate_gait_training_data, build_gait_model),
+    ("injury_risk", "Injury Risk Prediction", generate_injury_risk_data, build_injury_model),
+    ("performance", "Performance Prediction", generate_performance_data, build_performance_model),
+)
+
+# Source files whose contents determine the trained artifacts. The serving
+# kernels (_kernels) are deliberately absent: editing them must not retrain.
+_BUILD_SOURCES = (Path(__file__), Path(_builder_kernels.__file__))
+
+
+def _build_key(name: str, epochs: int, quantize: str) -> str:
+    """Content hash of everything that feeds a model's exported artifacts."""
+    digest = hashlib.sha256()
+    digest.update(json.dumps({
+        "name": name,
+        "epochs": epochs,
+        "quantize": quantize,
+        "tensorflow": tf.__version__,
+    }, sort_keys=True).encode())
+    for source in _BUILD_SOURCES:
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+# Also write the _norm_params.json that current app builds download
+LEGACY_NORM_JSON = True
+
+
+def _artifacts_current(name: str, model_path: Path, key: str) -> bool:
+    """True when the model and every norm params file on disk were built from ``key``."""
+    key_path = Path(f"{model_path}.sha")
+    return (
+        model_path.exists()
+        and (MODELS_DIR / f"{name}_norm_params.npz").exists()
+        and (not LEGACY_NORM_JSON or (MODELS_DIR / f"{name}_norm_params.json").exists())
+        and key_path.exists()
+        and key_path.read_text().strip() == key
+    )
+
+
+def build_all_models(epochs: int = 15, force: bool = False, export: bool = True) -> dict:
     """
     Train and export all 3 TFLite models.
 
+    A model is skipped when its ``.tflite.sha`` sidecar matches the hash of
+    the current build inputs; ``force=True`` retrains regardless. With
+    ``export=False`` (dev loops) every model is retrained but only saved as
+    ``{name}_model.keras``, skipping TFLite conversion; the deployed
+    artifacts are left untouched. The models
+    are independent and far too small to saturate the CPU alone, so stale
+    ones are trained concurrently (``model.fit`` releases the GIL); data
+    generation and TFLite conversion stay on the calling thread.
+
     Returns a summary dict with metadata for each model.
     """
     results = {}
-
-    # ── 1. Gait Form Model ──────────────────────────────────────
-    print("\n" + "="*60)
-    print("Training Gait Form Analysis Model...")
-    print("="*60)
-    X_gait, y_gait = generate_gait_training_data()
-    gait_model = build_gait_model()
-    train_model(gait_model, X_gait, y_gait, epochs=epochs)
-
-    gait_path = str(MODELS_DIR / "gait_form_model.tflite")
-    results["gait_form"] = export_tflite(gait_model, gait_path, X_gait, quantize="float16")
-    export_normalization_params(X_gait, "gait_form")
-    print(f"  → Exported: {gait_path} ({results['gait_form']['size_kb']} KB)")
-
-    # ── 2. Injury Risk Model ────────────────────────────────────
-    print("\n" + "="*60)
-    print("Training Injury Risk Prediction Model...")
-    print("="*60)
-    X_injury, y_injury = generate_injury_risk_data()
-    injury_model = build_injury_model()
-    train_model(injury_model, X_injury, y_injury, epochs=epochs)
-
-    injury_path = str(MODELS_DIR / "injury_risk_model.tflite")
-    results["injury_risk"] = export_tflite(injury_model, injury_path, X_injury, quantize="float16")
-    export_normalization_params(X_injury, "injury_risk")
-    print(f"  → Exported: {injury_path} ({results['injury_risk']['size_kb']} KB)")
-
-    # ── 3. Performance Prediction Model ─────────────────────────
-    print("\n" + "="*60)
-    print("Training Performance Prediction Model...")
-    print("="*60)
-    X_perf, y_perf = generate_performance_data()
-    perf_model = build_performance_model()
-    train_model(perf_model, X_perf, y_perf, epochs=epochs)
-
-    perf_path = str(MODELS_DIR / "performance_model.tflite")
-    results["performance"] = export_tflite(perf_model, perf_path, X_perf, quantize="float16")
-    export_normalization_params(X_perf, "performance")
-    print(f"  → Exported: {perf_path} ({results['performance']['size_kb']} KB)")
+    quantize = "int8"
+    stale = []
+
+    for name, title, generate_data, build_model in MODEL_SPECS:
+        model_path = MODELS_DIR / f"{name}_model.tflite"
+        key = _build_key(name, epochs, quantize)
+
+        if export and not force and _artifacts_current(name, model_path, key):
+            results[name] = read_tflite_metadata(str(model_path), quantize)
+            print(f"{title} Model unchanged — reusing {model_path}")
+            continue
+
+        print(f"Training {title} Model...")
+        X, y = generate_data()
+        stale.append((name, model_path, key, build_model(X, y), X, y))
+        results[name] = None  # placeholder keeps MODEL_SPECS order in the summary
+
+    with ThreadPoolExecutor(max_workers=max(len(stale), 1)) as executor:
+        futures = [
+            executor.submit(train_model, model, X, y, epochs=epochs)
+            for _, _, _, model, X, y in stale
+        ]
+        for future in futures:
+            future.result()
+
+    for name, model_path, key, model, X, y in stale:
+        if not export:
+            keras_path = str(MODELS_DIR / f"{name}_model.keras")
+            model.save(keras_path)
+            results[name] = keras_metadata(model, keras_path)
+            print(f"  → Saved: {keras_path} ({results[name]['size_kb']} KB, TFLite export skipped)")
+            continue
+
+        deployed, Z = _deployment_graph(model, X)
+        results[name] = export_tflite(deployed, str(model_path), Z, quantize=quantize)
+        export_normalization_params(X, name, results[name], legacy=LEGACY_NORM_JSON)
+        Path(f"{model_path}.sha").write_text(key)
+        print(f"  → Exported: {model_path} ({results[name]['size_kb']} KB)")
 
     # ── Summary ─────────────────────────────────────────────────
     print("\n" + "="*60)
@@ -446,4 +657,4 @@ def build_all_models(epochs: int = 50) -> dict:
 
 
 if __name__ == "__main__":
-    build_all_models(epochs=50)
+    build_all_models()